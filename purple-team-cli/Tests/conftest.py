@@ -1,5 +1,7 @@
 import pytest
 
+from purple_cli.core import config as config_module
+
 @pytest.fixture
 def sample_data():
     return {"key": "value"}
@@ -8,4 +10,105 @@ def sample_data():
 def setup_teardown():
     # Setup code here
     yield
-    # Teardown code here
\ No newline at end of file
+    # Teardown code here
+
+
+WINDOWS_INDEX = """\
+Defense Evasion:
+  T1070:
+    atomic_tests:
+    - name: clear logs
+    technique:
+      name: Indicator Removal
+      kill_chain_phases:
+      - phase_name: defense-evasion
+      x_mitre_platforms: [Windows]
+  T1999: Just a string
+credential-access:
+  T1003:
+    atomic_tests:
+    - name: dump lsass
+    technique:
+      name: OS Credential Dumping
+      kill_chain_phases:
+      - phase_name: credential-access
+      x_mitre_platforms: [Windows]
+  T1110:
+    atomic_tests: []
+    technique:
+      name: Brute Force
+      x_mitre_platforms: [Windows]
+discovery:
+  T1082:
+    atomic_tests:
+    - name: systeminfo
+    technique:
+      name: System Information Discovery
+      kill_chain_phases:
+      - phase_name: discovery
+      x_mitre_platforms: [Linux, Windows]
+"""
+
+LINUX_INDEX = """\
+credential-access:
+  T1003:
+    atomic_tests:
+    - name: dump shadow
+    technique:
+      name: OS Credential Dumping
+      kill_chain_phases:
+      - phase_name: credential-access
+      x_mitre_platforms: [Linux]
+discovery:
+  T1082:
+    atomic_tests:
+    - name: uname
+    technique:
+      name: System Information Discovery
+      kill_chain_phases:
+      - phase_name: discovery
+      x_mitre_platforms: [Linux, Windows]
+persistence:
+  T1053.003:
+    atomic_tests:
+    - name: cron
+    technique:
+      name: Cron
+      kill_chain_phases:
+      - phase_name: persistence
+      x_mitre_platforms: [Linux]
+"""
+
+
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """A configuration stored under tmp_path, used in place of the user's."""
+    app_config = config_module.AppConfig(str(tmp_path / "config.json"))
+    monkeypatch.setattr(config_module, "_config_instance", app_config)
+    return app_config
+
+
+@pytest.fixture
+def atomics_dir(tmp_path, app_config):
+    """An atomics folder with windows and linux index files, set as the atomics path."""
+    index_dir = tmp_path / "atomics" / "Indexes"
+    index_dir.mkdir(parents=True)
+    (index_dir / "windows-index.yaml").write_text(WINDOWS_INDEX)
+    (index_dir / "linux-index.yaml").write_text(LINUX_INDEX)
+    app_config.atomics_path = str(tmp_path / "atomics")
+    return tmp_path / "atomics"
+
+
+@pytest.fixture
+def interactive(app_config):
+    """The interactive module with its index data and lookups cleared before and after."""
+    from purple_cli import interactive
+
+    def clear():
+        interactive._IDX.reset()
+        interactive._IDX.file_cache.clear()
+        interactive.clear_index_lookup_caches()
+
+    clear()
+    yield interactive
+    clear()
@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from purple_cli.core.executor import PowerShellSession
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="the fake PowerShell is a shebang script")
+
+# Answers each line PowerShellSession writes with the output of the canned
+# command it contains, followed by the session's sentinel
+FAKE_POWERSHELL = textwrap.dedent("""\
+    #!{python}
+    import re, sys, time
+    for line in sys.stdin:
+        if line.strip() == "exit":
+            break
+        sentinel = re.search(r'Write-Output "(\\S+):\\$__ok"', line).group(1)
+        ok = True
+        echo = re.search(r"\\becho (\\w+)", line)
+        if re.search(r"\\bargs\\b", line):
+            print(" ".join(sys.argv[1:]))
+        elif echo:
+            print(echo.group(1))
+            print("second line")
+        elif re.search(r"\\bfail\\b", line):
+            print("it failed")
+            ok = False
+        elif re.search(r"\\bhang\\b", line):
+            time.sleep(60)
+        elif re.search(r"\\bdie\\b", line):
+            print("dying")
+            sys.exit(1)
+        print(f"{{sentinel}}:{{ok}}", flush=True)
+""")
+
+
+@pytest.fixture
+def fake_powershell(tmp_path):
+    path = tmp_path / "pwsh"
+    path.write_text(FAKE_POWERSHELL.format(python=sys.executable))
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def session(fake_powershell):
+    with PowerShellSession(fake_powershell) as ps:
+        yield ps
+
+
+def test_session_loads_profile_without_prompting(session):
+    # The profile is where Invoke-AtomicRedTeam is usually imported
+    success, output = session.run("args", timeout=10)
+    assert success
+    assert output.split() == ["-NoLogo", "-NonInteractive", "-Command", "-"]
+
+
+def test_session_returns_output_before_sentinel(session):
+    success, output = session.run("echo hello", timeout=10)
+    assert success
+    assert output == "hello\nsecond line\n"
+    assert "__PURPLE_CLI_DONE_" not in output
+
+
+def test_session_reports_failure_and_keeps_running(session):
+    assert session.run("fail", timeout=10) == (False, "it failed\n")
+    assert session.run("echo again", timeout=10) == (True, "again\nsecond line\n")
+
+
+def test_session_timeout_kills_process(session):
+    with pytest.raises(subprocess.TimeoutExpired):
+        session.run("hang", timeout=0.5)
+    assert not session.alive
+    with pytest.raises(RuntimeError):
+        session.run("echo late", timeout=10)
+
+
+def test_session_exit_without_sentinel(session):
+    with pytest.raises(RuntimeError, match="dying"):
+        session.run("die", timeout=10)
+
+
+def test_session_close_stops_process(fake_powershell):
+    ps = PowerShellSession(fake_powershell)
+    ps.close()
+    assert not ps.alive
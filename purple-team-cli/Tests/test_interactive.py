@@ -0,0 +1,207 @@
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+
+def test_parse_search_options_defaults(interactive):
+    assert interactive._parse_search_options("credential dumping") == ("credential dumping", False, False)
+
+
+def test_parse_search_options_with_options(interactive):
+    result = interactive._parse_search_options('"lsass dump" platform=a Detail=f')
+    assert result == ("lsass dump", True, True)
+
+
+def test_parse_search_options_rejects_unknown_option(interactive):
+    with pytest.raises(ValueError):
+        interactive._parse_search_options("T1003 platform=X")
+    with pytest.raises(ValueError):
+        interactive._parse_search_options("T1003 color=red")
+
+
+def test_parse_search_options_rejects_unbalanced_quotes(interactive):
+    with pytest.raises(ValueError):
+        interactive._parse_search_options('"unterminated')
+
+
+class _ScriptedPrompt:
+    """Stands in for rich's Prompt, answering with the given replies in order."""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.asked = []
+
+    def ask(self, prompt, default=""):
+        self.asked.append(prompt)
+        return self.answers.pop(0)
+
+
+@pytest.fixture
+def scripted(interactive, monkeypatch):
+    """Returns a function that scripts the prompt answers; printed output goes to .output."""
+    output = io.StringIO()
+    monkeypatch.setattr(interactive, "console", Console(file=output, width=120))
+
+    def script(*answers):
+        prompt = _ScriptedPrompt(answers)
+        prompt.output = output
+        monkeypatch.setattr(interactive, "Prompt", prompt)
+        return prompt
+
+    return script
+
+
+ROWS = [(f"Row {i}",) for i in range(1, 8)]
+
+
+def test_paged_select_returns_zero_based_index(interactive, scripted):
+    scripted("2")
+    assert interactive._paged_select("Items", (("Name", None),), ROWS, "item", page_size=10) == 1
+
+
+def test_paged_select_goes_back_on_zero(interactive, scripted):
+    scripted("0")
+    assert interactive._paged_select("Items", (("Name", None),), ROWS, "item", page_size=10) is None
+
+
+def test_paged_select_asks_again_on_invalid_answers(interactive, scripted):
+    prompt = scripted("8", "", "x", "-1", "3")
+    assert interactive._paged_select("Items", (("Name", None),), ROWS, "item", page_size=10) == 2
+    assert prompt.output.getvalue().count("Invalid choice") == 4
+
+
+def test_paged_select_pages_through_rows(interactive, scripted):
+    prompt = scripted("n", "n", "n", "p", "4")
+    assert interactive._paged_select("Items", (("Name", None),), ROWS, "item", page_size=3) == 3
+    output = prompt.output.getvalue()
+    assert "page 1/3" in output and "page 3/3" in output
+    # Next on the last page stays there
+    assert output.count("page 3/3") == 2
+    assert "[N]ext" in prompt.asked[0]
+
+
+def test_read_index_tactics(interactive, atomics_dir):
+    tactics = interactive._read_index_tactics(atomics_dir / "Indexes" / "windows-index.yaml")
+    assert tactics == ("credential-access", "defense-evasion", "discovery")
+
+
+def test_read_index_tactics_unusable_files(interactive, tmp_path):
+    not_a_mapping = tmp_path / "list-index.yaml"
+    not_a_mapping.write_text("- a\n- b\n")
+    invalid = tmp_path / "broken-index.yaml"
+    invalid.write_text("a: [unclosed\n")
+    assert interactive._read_index_tactics(not_a_mapping) is None
+    assert interactive._read_index_tactics(invalid) is None
+    assert interactive._read_index_tactics(tmp_path / "missing-index.yaml") is None
+
+
+def _forget_loaded_index(interactive):
+    """Drops the index data held in memory, as a restart of the CLI would."""
+    interactive._IDX.reset()
+    interactive._IDX.file_cache.clear()
+    interactive.clear_index_lookup_caches()
+
+
+def test_index_cache_reused_until_file_changes(interactive, atomics_dir, monkeypatch):
+    interactive.load_index_data()
+    parsed = []
+    parse_index_file = interactive._parse_index_file
+    monkeypatch.setattr(interactive, "_parse_index_file", lambda f: parsed.append(f.name) or parse_index_file(f))
+
+    _forget_loaded_index(interactive)
+    interactive.load_index_data()
+    assert parsed == []
+
+    linux_index = atomics_dir / "Indexes" / "linux-index.yaml"
+    linux_index.write_text(linux_index.read_text() + "\n")
+    _forget_loaded_index(interactive)
+    platforms, data = interactive.load_index_data()
+    assert parsed == ["linux-index.yaml"]
+    assert set(data["linux"]["persistence"]) == {"T1053.003"}
+
+
+def _parsed_windows_index(interactive, atomics_dir):
+    index_file = atomics_dir / "Indexes" / "windows-index.yaml"
+    _platform, data, _warnings = interactive._parse_index_file(index_file)
+    return index_file, interactive._index_file_key(index_file), data
+
+
+def test_index_cache_round_trip(interactive, atomics_dir):
+    index_file, key, data = _parsed_windows_index(interactive, atomics_dir)
+    interactive._write_index_cache(index_file, key, data)
+
+    cached = interactive._read_index_cache(index_file, key)
+    assert cached == data
+    assert isinstance(cached["credential-access"]["T1003"]["platforms"], frozenset)
+
+
+def test_index_cache_rejects_changed_or_foreign_files(interactive, atomics_dir):
+    index_file, key, data = _parsed_windows_index(interactive, atomics_dir)
+    interactive._write_index_cache(index_file, key, data)
+
+    # The index file changed since it was cached
+    assert interactive._read_index_cache(index_file, (key[0] + 1, key[1])) is None
+    # The cache entry was written for another file, or by another cache version
+    cache_path = interactive._index_cache_path(index_file)
+    for field, value in (("path", "/elsewhere/windows-index.yaml"), ("version", -1)):
+        cached = json.loads(cache_path.read_text())
+        cached[field] = value
+        cache_path.write_text(json.dumps(cached))
+        assert interactive._read_index_cache(index_file, key) is None
+
+
+def test_index_cache_rejects_malformed_files(interactive, atomics_dir):
+    index_file, key, data = _parsed_windows_index(interactive, atomics_dir)
+    interactive._write_index_cache(index_file, key, data)
+    cache_path = interactive._index_cache_path(index_file)
+    good = json.loads(cache_path.read_text())
+
+    cache_path.write_text("{not json")
+    assert interactive._read_index_cache(index_file, key) is None
+
+    bad_record = json.loads(json.dumps(good))
+    bad_record["records"][0][0] = 42
+    cache_path.write_text(json.dumps(bad_record))
+    assert interactive._read_index_cache(index_file, key) is None
+
+    bad_row = json.loads(json.dumps(good))
+    bad_row["tactics"] = {"persistence": {"T1053": len(good["records"])}}
+    cache_path.write_text(json.dumps(bad_row))
+    assert interactive._read_index_cache(index_file, key) is None
+
+
+def test_get_techniques_for_platform_and_tactic(interactive, atomics_dir):
+    techniques = interactive.get_techniques("windows", "credential-access")
+    assert set(techniques) == {"T1003"}
+    assert techniques["T1003"]["platforms"] == frozenset({"windows"})
+
+
+def test_get_techniques_skips_entries_without_tests(interactive, atomics_dir):
+    techniques = interactive.get_techniques(platform="windows")
+    assert "T1110" not in techniques
+    assert techniques["T1999"]["has_tests"] is False
+
+
+def test_get_techniques_merges_platforms(interactive, atomics_dir):
+    techniques = interactive.get_techniques(tactic="credential-access")
+    assert set(techniques) == {"T1003"}
+    merged = techniques["T1003"]
+    assert merged["platforms"] == frozenset({"windows", "linux"})
+    assert merged["platforms_str"] == "Linux, Windows"
+
+    # The per-platform entries are left as they were parsed
+    assert interactive.get_techniques("windows", "credential-access")["T1003"]["platforms"] == frozenset({"windows"})
+    assert interactive.get_techniques("linux", "credential-access")["T1003"]["platforms"] == frozenset({"linux"})
+
+
+def test_get_techniques_reuses_entries_with_nothing_to_merge(interactive, atomics_dir):
+    merged = interactive.get_techniques(tactic="discovery")["T1082"]
+    per_platform = [interactive.get_techniques(p, "discovery")["T1082"] for p in ("linux", "windows")]
+    assert any(merged is entry for entry in per_platform)
+    assert merged["platforms"] == frozenset({"windows", "linux"})
+
+
+def test_get_techniques_across_all_platforms(interactive, atomics_dir):
+    assert set(interactive.get_techniques()) == {"T1003", "T1053.003", "T1070", "T1082", "T1999"}
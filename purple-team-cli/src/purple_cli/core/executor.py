@@ -5,15 +5,107 @@ This module provides functionality to execute Atomic Red Team tests
 using the Invoke-AtomicRedTeam PowerShell module.
 """
 
+import queue
+import shutil
 import subprocess
 import sys
 import re
+import threading
+import time
+import uuid
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict, Any, Union
 from pathlib import Path
 
 from purple_cli.core.config import get_config
 
 
+# Flags for read-only PowerShell invocations (listing tests and details).
+# Skipping the user profile avoids parsing $PROFILE and auto-loading its
+# modules on every spawn; Invoke-AtomicRedTeam is still found via module
+# autoloading when installed with Install-Module.
+NO_PROFILE_FLAGS = ["-NoProfile", "-NonInteractive"]
+
+# Only the end of a failed command's stdout/stderr is kept in the error
+# message, so a runaway script can't produce an arbitrarily large string
+ERROR_OUTPUT_TAIL_CHARS = 4096
+
+# Scriptblock used to list tests. The technique filter and switches are
+# passed as literal arguments and bound to parameters by PowerShell, so
+# user input is never spliced into the script text itself.
+LIST_TESTS_SCRIPT = (
+    "& { param($t, $d, $a) "
+    "if ($d) { Invoke-AtomicTest -AtomicTechnique $t -ShowDetails -AnyOS:$a } "
+    "else { Invoke-AtomicTest -AtomicTechnique $t -ShowDetailsBrief -AnyOS:$a } }"
+)
+
+
+@lru_cache(maxsize=8)
+def resolve_powershell_path(powershell_path: str) -> str:
+    """
+    Resolves the configured PowerShell executable to a full path once.
+
+    Args:
+        powershell_path: The configured executable name or path.
+
+    Returns:
+        The absolute path found on PATH, or the configured value if it
+        cannot be resolved (so the usual "not found" error still surfaces).
+    """
+    return shutil.which(powershell_path) or powershell_path
+
+
+def warm_up_powershell() -> None:
+    """
+    Starts and exits PowerShell once so the first real command doesn't pay
+    the full runtime start-up cost. Errors are ignored.
+    """
+    config = get_config()
+    command = [resolve_powershell_path(config.powershell_path), *NO_PROFILE_FLAGS, "-Command", "$null"]
+    try:
+        subprocess.run(command, capture_output=True, timeout=config.timeout)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def _ps_quote(value: str) -> str:
+    """Quotes a value as a PowerShell single-quoted string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _ps_bool(value: bool) -> str:
+    """Returns the PowerShell literal for a boolean."""
+    return "$true" if value else "$false"
+
+
+def build_list_tests_command(
+    filter_str: Optional[str] = None,
+    show_details: bool = False,
+    any_os: bool = False,
+) -> List[str]:
+    """
+    Builds the PowerShell command to list tests matching a filter.
+
+    Args:
+        filter_str: Technique ID or search term. Lists all tests if empty.
+        show_details: Whether to show full details instead of brief details.
+        any_os: Whether to include tests for all platforms.
+
+    Returns:
+        A list representing the PowerShell command to execute.
+    """
+    config = get_config()
+    return [
+        resolve_powershell_path(config.powershell_path),
+        *NO_PROFILE_FLAGS,
+        "-Command",
+        LIST_TESTS_SCRIPT,
+        _ps_quote(filter_str or "All"),
+        _ps_bool(show_details),
+        _ps_bool(any_os),
+    ]
+
+
 def validate_technique_id(technique_id: str) -> bool:
     """
     Validates that the technique ID follows the expected format (e.g., T1234 or T1234.001).
@@ -38,6 +130,7 @@ def build_command(
     show_details_brief: bool = False,
     session: Optional[str] = None,
     any_os: bool = False,
+    no_profile: bool = False,
 ) -> List[str]:
     """
     Builds the PowerShell command to execute an Atomic Red Team test.
@@ -52,15 +145,20 @@ def build_command(
         show_details_brief: Whether to show brief details of the test.
         session: Optional PowerShell session name to run the test on.
         any_os: Whether to include tests for all platforms.
+        no_profile: Whether to start PowerShell with -NoProfile -NonInteractive.
+                    Intended for read-only listing calls.
 
     Returns:
         A list representing the PowerShell command to execute.
     """
     config = get_config()
-    powershell_path = config.powershell_path
+    powershell_path = resolve_powershell_path(config.powershell_path)
 
     # Base PowerShell command
-    command = [powershell_path, "-Command"]
+    command = [powershell_path]
+    if no_profile:
+        command.extend(NO_PROFILE_FLAGS)
+    command.append("-Command")
 
     # Build the Invoke-AtomicTest command
     # Use -AtomicTechnique for clarity, though often optional
@@ -100,6 +198,125 @@ def build_command(
     return command
 
 
+class PowerShellSession:
+    """
+    A long-lived PowerShell process that runs commands one after another.
+
+    Starting PowerShell costs far more than most atomic tests take to run,
+    so running a batch of tests (e.g. a playbook) through one session pays
+    that cost once. Commands are written to the process's stdin, and the end
+    of each command's output is marked by a unique sentinel line.
+
+    Unlike the listing calls, the process loads the user profile, since that is
+    where Invoke-AtomicRedTeam is commonly imported, but it can't prompt for
+    input and each script's stdin is empty. Each script runs in its own scope
+    and restores the current directory afterwards, so tests don't see each
+    other's variables or location.
+
+    Use as a context manager so the process is always shut down:
+
+        with PowerShellSession() as ps:
+            success, output = ps.run("Invoke-AtomicTest T1003")
+    """
+
+    def __init__(self, powershell_path: Optional[str] = None):
+        """
+        Starts the PowerShell process.
+
+        Args:
+            powershell_path: Executable to start. Defaults to the configured one.
+
+        Raises:
+            OSError: If PowerShell cannot be started.
+        """
+        path = resolve_powershell_path(powershell_path or get_config().powershell_path)
+        self._sentinel = f"__PURPLE_CLI_DONE_{uuid.uuid4().hex}__"
+        self._process = subprocess.Popen(
+            [path, "-NoLogo", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Merged so a full stderr pipe can't stall the process
+            text=True,
+            bufsize=1,
+        )
+        # A reader thread lets run() wait for output with a timeout
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self) -> None:
+        """Forwards output lines to the queue; None marks the end of the stream."""
+        for line in self._process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the PowerShell process is still running."""
+        return self._process.poll() is None
+
+    def run(self, script: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Runs a single-line script in the session and waits for it to finish.
+
+        Args:
+            script: The PowerShell to run.
+            timeout: Seconds to wait before giving up. The session is closed on timeout.
+
+        Returns:
+            A tuple of (success, output). Like a separate PowerShell process's exit code,
+            success is False if the script errored or a native command it ran last failed.
+
+        Raises:
+            subprocess.TimeoutExpired: If the script doesn't finish in time.
+            RuntimeError: If the PowerShell process has exited.
+        """
+        if not self.alive:
+            raise RuntimeError("PowerShell session has exited")
+
+        self._process.stdin.write(
+            f"$global:LASTEXITCODE = 0; $__ok = $false; Push-Location; "
+            f"try {{ $null | & {{ {script} }}; $__ok = $? -and $LASTEXITCODE -eq 0 }} "
+            f"catch {{ $_ | Out-String }} finally {{ Pop-Location }}; "
+            f"Write-Output \"{self._sentinel}:$__ok\"\n"
+        )
+        self._process.stdin.flush()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        output: List[str] = []
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                # The script is stuck, so don't wait for it to exit cleanly
+                self._process.kill()
+                self._process.wait()
+                raise subprocess.TimeoutExpired(script, timeout, output="".join(output))
+            if line is None:
+                raise RuntimeError("PowerShell session exited unexpectedly:\n" + "".join(output))
+            if line.startswith(self._sentinel):
+                return line.rstrip().endswith(":True"), "".join(output)
+            output.append(line)
+
+    def close(self) -> None:
+        """Asks PowerShell to exit, killing it if it doesn't."""
+        if self.alive:
+            try:
+                self._process.stdin.write("exit\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
+    def __enter__(self) -> "PowerShellSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
 def run_atomic_test(
     technique_id: str,
     test_numbers: Optional[List[int]] = None,
@@ -111,6 +328,7 @@ def run_atomic_test(
     any_os: bool = False,
     timeout: Optional[int] = None,
     capture_output: bool = True,  # Parameter to control output capture
+    ps_session: Optional[PowerShellSession] = None,
 ) -> Tuple[bool, str]:
     """
     Executes an Atomic Red Team test using Invoke-AtomicTest.
@@ -127,6 +345,8 @@ def run_atomic_test(
         timeout: Optional timeout in seconds.
         capture_output: Whether to capture and return the command output. If False,
                        allows interactive programs to display normally.
+        ps_session: Optional running PowerShellSession to run the test in instead of
+                    starting a new PowerShell process. Only used when capturing output.
 
     Returns:
         A tuple containing (success_flag, output_text).
@@ -156,6 +376,14 @@ def run_atomic_test(
 
     # Execute the command
     try:
+        if capture_output and ps_session is not None and ps_session.alive:
+            # Reuse the already running PowerShell; the script is the last element
+            success, output = ps_session.run(command[-1], timeout=timeout)
+            if success:
+                return True, output
+            error_msg = f"Error: Command failed.\nOutput: {output[-ERROR_OUTPUT_TAIL_CHARS:]}"
+            print(error_msg, file=sys.stderr)
+            return False, error_msg
         if capture_output:
             # Capture output (good for logging, but may prevent GUI apps from displaying)
             result = subprocess.run(
@@ -189,9 +417,9 @@ def run_atomic_test(
         error_msg = f"Error: Command failed with exit code {e.returncode}.\n"
         # Access stdout/stderr safely as they might be None if capture_output=False
         if e.stdout:
-             error_msg += f"Stdout: {e.stdout}\n"
+             error_msg += f"Stdout: {e.stdout[-ERROR_OUTPUT_TAIL_CHARS:]}\n"
         if e.stderr:
-             error_msg += f"Stderr: {e.stderr}"
+             error_msg += f"Stderr: {e.stderr[-ERROR_OUTPUT_TAIL_CHARS:]}"
         print(error_msg, file=sys.stderr)
         return False, error_msg
     except subprocess.TimeoutExpired:
@@ -232,9 +460,6 @@ def list_available_tests(
     if not atomics_path.exists() or not atomics_path.is_dir():
         return False, f"Error: Atomics directory not found at '{atomics_path}'."
 
-    # Use PowerShell to list available tests
-    command = [config.powershell_path, "-Command"]
-
     # Build the command
     # For listing, we generally want details, so we pass the flags to build_command
     command_to_build = build_command(
@@ -242,6 +467,7 @@ def list_available_tests(
         show_details=show_details,
         show_details_brief=show_details_brief,
         any_os=any_os,
+        no_profile=True,
         # Don't include test numbers, prereqs, cleanup, or session for listing
     )
     # build_command adds the invoke_cmd string as the last element
@@ -251,7 +477,7 @@ def list_available_tests(
     if technique_id == "All" and not show_details and show_details_brief:
          invoke_cmd = "Invoke-AtomicTest -ListTechniques"
          # Rebuild the command list with just powershell path and the specific list command
-         command = [config.powershell_path, "-Command", invoke_cmd]
+         command = [resolve_powershell_path(config.powershell_path), *NO_PROFILE_FLAGS, "-Command", invoke_cmd]
     else:
          # For other listing scenarios (specific technique, full details), use the built command
          command = command_to_build
@@ -314,6 +540,7 @@ def get_test_details(
         show_details=show_details,
         show_details_brief=not show_details, # If not showing full details, show brief
         any_os=any_os,
+        no_profile=True,
         # Don't include prereqs, cleanup, or session for getting details
     )
 
@@ -5,10 +5,13 @@ This module provides functionality to define and execute sequences
 of Atomic Red Team tests as playbooks.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
+from functools import lru_cache
 
-from purple_cli.core.executor import run_atomic_test
+from purple_cli.core.executor import PowerShellSession, run_atomic_test
 
 
 @dataclass(frozen=True)
@@ -43,6 +46,10 @@ class Playbook:
     blue_team_guidance: str = ""
 
 
+# Upper bound on prerequisite checks run at the same time
+MAX_PREREQ_CHECK_WORKERS = 8
+
+
 # Predefined playbooks
 PLAYBOOKS: Dict[str, Playbook] = {
     "credential-access": Playbook(
@@ -185,6 +192,19 @@ PLAYBOOKS: Dict[str, Playbook] = {
 }
 
 
+@lru_cache(maxsize=1)
+def get_playbook_index() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the name and description of every playbook without touching their tests.
+
+    Playbooks are defined in this module, so the index is built once.
+
+    Returns:
+        Tuple of (name, description) pairs.
+    """
+    return tuple((name, playbook.description) for name, playbook in PLAYBOOKS.items())
+
+
 def get_available_playbooks() -> List[Dict[str, str]]:
     """
     Get information about all available playbooks.
@@ -193,8 +213,8 @@ def get_available_playbooks() -> List[Dict[str, str]]:
         List of dictionaries with playbook information.
     """
     return [
-        {"name": name, "description": playbook.description}
-        for name, playbook in PLAYBOOKS.items()
+        {"name": name, "description": description}
+        for name, description in get_playbook_index()
     ]
 
 
@@ -235,31 +255,88 @@ def execute_playbook(
     playbook = get_playbook(playbook_name)
     if not playbook:
         return False, [{"error": f"Playbook '{playbook_name}' not found"}]
+
+    # Prerequisite checks can overlap; with a single worker, one persistent session is faster
+    workers = min(MAX_PREREQ_CHECK_WORKERS, len(playbook.tests), os.cpu_count() or 1)
+    if check_prereqs and not get_prereqs and not cleanup and workers > 1:
+        return _check_prereqs_concurrently(playbook, workers, session)
     
     all_successful = True
     results = []
+
+    # Run every test in one PowerShell process rather than starting one per test;
+    # if it can't be started, each test falls back to its own process
+    try:
+        ps_session: Optional[PowerShellSession] = PowerShellSession()
+    except OSError:
+        ps_session = None
+
+    try:
+        for test in playbook.tests:
+            print(f"\nExecuting: {test.technique_id} - {test.description}")
+            success, output = run_atomic_test(
+                technique_id=test.technique_id,
+                test_numbers=test.test_numbers,
+                check_prereqs=check_prereqs,
+                get_prereqs=get_prereqs,
+                cleanup=cleanup,
+                session=session,
+                show_details_brief=True,
+                ps_session=ps_session,
+            )
+
+            results.append(_test_result(test, success, output))
+            if not success:
+                all_successful = False
+    finally:
+        if ps_session is not None:
+            ps_session.close()
     
-    for test in playbook.tests:
-        print(f"\nExecuting: {test.technique_id} - {test.description}")
-        success, output = run_atomic_test(
+    return all_successful, results
+
+
+def _test_result(test: PlaybookTest, success: bool, output: str) -> Dict[str, Any]:
+    """Builds the result entry reported for one playbook test."""
+    return {
+        "technique_id": test.technique_id,
+        "description": test.description,
+        "success": success,
+        "output": output,
+    }
+
+
+def _check_prereqs_concurrently(
+    playbook: Playbook,
+    workers: int,
+    session: Optional[str] = None,
+) -> Tuple[bool, List[Dict[str, Any]]]:
+    """
+    Checks the prerequisites of every test in a playbook at the same time.
+
+    Prerequisite checks only inspect the system and don't depend on each
+    other, so they can overlap. Installing prerequisites and running tests
+    stay sequential since those can interfere with each other.
+
+    Args:
+        playbook: The playbook whose tests to check.
+        workers: How many checks to run at once.
+        session: Optional PowerShell session name to run the checks on.
+
+    Returns:
+        Tuple of (success, results) in the same form as execute_playbook, in playbook order.
+    """
+    def check(test: PlaybookTest) -> Tuple[bool, str]:
+        return run_atomic_test(
             technique_id=test.technique_id,
             test_numbers=test.test_numbers,
-            check_prereqs=check_prereqs,
-            get_prereqs=get_prereqs,
-            cleanup=cleanup,
+            check_prereqs=True,
             session=session,
             show_details_brief=True,
         )
-        
-        result = {
-            "technique_id": test.technique_id,
-            "description": test.description,
-            "success": success,
-            "output": output,
-        }
-        
-        results.append(result)
-        if not success:
-            all_successful = False
-    
-    return all_successful, results
\ No newline at end of file
+
+    print(f"\nChecking prerequisites for {len(playbook.tests)} tests...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(check, playbook.tests))
+
+    results = [_test_result(test, success, output) for test, (success, output) in zip(playbook.tests, outcomes)]
+    return all(result["success"] for result in results), results
@@ -1,27 +1,35 @@
 import os
 import sys
-from typing import Dict, List, Optional, Callable, Tuple, Any, Set # Added Any, Set
-import yaml
+from typing import Dict, List, Optional, Callable, Tuple, Any, Set, Final, Mapping, FrozenSet, Deque # Added Any, Set
 from pathlib import Path
 import re 
+import shlex
 import subprocess
-import socket
 import shutil
 import importlib.util
 import time
+import locale
 import json # Added for parsing credentials
+import hashlib
+import mmap
+from collections import OrderedDict, deque
+from functools import lru_cache
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt, Confirm 
-from rich.panel import Panel
-from rich.table import Table
 from rich import markup # Added for escaping markup
 # Removed unused rprint import
 
 # Removed unused list_available_tests import
-from purple_cli.core.executor import run_atomic_test, get_test_details, build_command 
-from purple_cli.core.playbook import get_available_playbooks, get_playbook, execute_playbook
-from purple_cli.core.config import get_config, set_config
+from purple_cli.core.executor import get_test_details, build_list_tests_command, resolve_powershell_path, warm_up_powershell, ERROR_OUTPUT_TAIL_CHARS
+from purple_cli.core.config import AppConfig, get_config, set_config
+
+# yaml, asyncio, socket and the process pool (multiprocessing) are imported
+# where they are used: together they add tens of milliseconds to startup, and many
+# menu paths never need them
 
 
 console = Console()
@@ -42,10 +50,106 @@ TACTICS = {
     "impact": "Impact"
 }
 
-# Enhanced cache structure to store more detailed technique information
-# {platform: {tactic: {technique_id: {name, platforms, phases, has_tests}}}}
-INDEX_DATA_CACHE: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
-AVAILABLE_PLATFORMS: List[str] = []
+# Patterns compiled once at import
+_TECHNIQUE_ID_RE = re.compile(r"^T\d{4}(?:\.\d{3})?$", re.IGNORECASE)
+_TEST_NUMBERS_RE = re.compile(r"[\d,\s]*")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Raw tactic name -> normalized, interned tactic key (see _normalize_tactic)
+_TACTIC_NORM: Dict[str, str] = {t_id: sys.intern(t_id) for t_id in TACTICS}
+
+
+def _normalize_tactic(tactic: str) -> str:
+    """Normalize a tactic name (lowercase, spaces to hyphens), caching the interned result."""
+    norm = _TACTIC_NORM.get(tactic)
+    if norm is None:
+        norm = _TACTIC_NORM[tactic] = sys.intern(tactic.lower().replace(' ', '-'))
+    return norm
+
+
+# Raw platform/phase name -> lowercased, interned name (see _lower_name)
+_LOWER_NAMES: Dict[str, str] = {}
+
+
+def _lower_name(name: str) -> str:
+    """Lowercase a platform or phase name, caching the interned result."""
+    lowered = _LOWER_NAMES.get(name)
+    if lowered is None:
+        lowered = _LOWER_NAMES[name] = sys.intern(name.lower())
+    return lowered
+
+
+@dataclass(slots=True)
+class _IndexState:
+    """Loaded index data and the lookup structures derived from it."""
+    # Enhanced cache structure to store more detailed technique information
+    # {platform: {tactic: {technique_id: {name, platforms, phases, platforms_str, phases_str, has_tests}}}}
+    # Platforms are parsed on first use; `platforms` lists every index file found.
+    data: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = field(default_factory=dict)
+    platforms: List[str] = field(default_factory=list)
+    files: Dict[str, Path] = field(default_factory=dict)
+    # Parsed index files as {path: (mtime_ns, size, platform_data)} in least recently
+    # used order; kept across reset() since entries are validated by stat
+    file_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = field(default_factory=OrderedDict)
+    # Background parses started by get_tactics_for_platform, keyed by index file path
+    prefetch: Dict[str, "Future[Any]"] = field(default_factory=dict)
+    # Flat view of `data`: one row per (platform, tactic, technique),
+    # stored as parallel lists, plus reverse indexes from platform/tactic to rows
+    row_tech_ids: List[str] = field(default_factory=list)
+    row_infos: List[Dict[str, Any]] = field(default_factory=list)
+    by_platform: Dict[str, Set[int]] = field(default_factory=dict)
+    by_tactic: Dict[str, Set[int]] = field(default_factory=dict)
+    # Technique ID -> platforms whose (loaded) index lists it
+    platforms_by_tech: Dict[str, Set[str]] = field(default_factory=dict)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the index files have been discovered."""
+        return bool(self.platforms)
+
+    @property
+    def fully_parsed(self) -> bool:
+        """True once every discovered index file has been parsed."""
+        return len(self.data) == len(self.files)
+
+    def reset(self) -> None:
+        """Forgets all index data so it is rediscovered on next use."""
+        self.data, self.platforms, self.files, self.prefetch = {}, [], {}, {}
+        self.row_tech_ids, self.row_infos, self.by_platform, self.by_tactic = [], [], {}, {}
+        self.platforms_by_tech = {}
+
+
+_IDX = _IndexState()
+
+# Index files are named '<platform>-index.yaml'
+INDEX_FILE_SUFFIX = "-index.yaml"
+
+
+def _index_file_platform(file_name: str) -> Optional[str]:
+    """Return the lowercased platform of an index file name, or None if it isn't one."""
+    if len(file_name) > len(INDEX_FILE_SUFFIX) and file_name.endswith(INDEX_FILE_SUFFIX):
+        return file_name[:-len(INDEX_FILE_SUFFIX)].lower()
+    return None
+
+
+# Technique platform/phase sets are frozensets; entries without any share this one
+_EMPTY_SET: FrozenSet[str] = frozenset()
+
+# Parsed index files are cached in this directory (in the config directory),
+# one file per index file, each reused while its size and modification time are unchanged
+INDEX_CACHE_DIR = "index_cache"
+# Bump when the shape of the parsed technique data or of the cache files changes
+INDEX_CACHE_VERSION = 7
+
+# Most parsed index files kept in memory, e.g. across switches of the atomics path
+INDEX_FILE_CACHE_MAX = 100
+
+# Index files are parsed in worker processes only when together they are at
+# least this large (in bytes); below it, starting the workers costs more than it saves
+PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# Index files larger than this (in bytes) are memory-mapped while parsing
+INDEX_MMAP_THRESHOLD = 1024 * 1024
 
 # Prerequisites for Phishing Simulation
 REQUIRED_PYTHON_PACKAGES_PHISHING: List[str] = ["requests", "python-dotenv"] # Example: adjust as needed
@@ -54,6 +158,203 @@ REQUIRED_PYTHON_PACKAGES_PHISHING: List[str] = ["requests", "python-dotenv"] # E
 PHISHING_SERVER_PROCESS: Optional[subprocess.Popen] = None
 
 
+# Markup used by print_header for screen titles
+_HEADER_TMPL: Final = "[bold purple]{}[/bold purple]"
+
+
+def _format_menu(options: Tuple[str, ...], start: int = 1) -> str:
+    """Render a numbered menu as a single Rich markup string."""
+    return "\n".join(
+        f"[bold cyan]{i}.[/bold cyan] {option}" for i, option in enumerate(options, start)
+    )
+
+
+# Menu options and their rendered text, built once at import time
+_MAIN_MENU_OPTIONS: Final = (
+    "List Tests",
+    "Run Test",
+    "List Playbooks",
+    "Run Playbook",
+    "Help",
+    "Configuration",
+    "Exit",
+)
+_MAIN_MENU_TEXT: Final = _format_menu(_MAIN_MENU_OPTIONS)
+
+_LIST_TESTS_MENU_OPTIONS: Final = (
+    "Search by keyword or technique ID",
+    "Browse by Tactic",
+    "Browse by Platform",
+    "Show All Tests (using Invoke-AtomicTest)",
+    "Back to Main Menu",
+)
+_LIST_TESTS_MENU_TEXT: Final = _format_menu(_LIST_TESTS_MENU_OPTIONS)
+
+# Next List Tests screen to show: (screen name, keyword arguments), or None to leave the menu
+MenuState = Optional[Tuple[str, Dict[str, Any]]]
+
+_TEST_OPERATION_OPTIONS: Final = (
+    "Execute Test",
+    "Check Prerequisites Only",
+    "Install Prerequisites",
+    "Cleanup After Test",
+)
+_TEST_OPERATION_TEXT: Final = _format_menu(_TEST_OPERATION_OPTIONS)
+
+_PLAYBOOK_OPERATION_OPTIONS: Final = (
+    "Execute Playbook",
+    "Check Prerequisites Only",
+    "Install Prerequisites",
+    "Cleanup After Tests",
+)
+_PLAYBOOK_OPERATION_TEXT: Final = _format_menu(_PLAYBOOK_OPERATION_OPTIONS)
+
+# Status cells of the playbook test summary
+_SUMMARY_SUCCESS: Final = "[green]✓ Success[/green]"
+_SUMMARY_FAILED: Final = "[red]✗ Failed[/red]"
+
+# Configuration options are numbered after the 5 displayed config items
+_CONFIG_OPTIONS_START: Final = 6
+_CONFIG_MENU_OPTIONS: Final = (
+    "Set Atomics Path",
+    "Set PowerShell Path",
+    "Set Command Timeout",
+    "Set Phishing Site Path",
+    "Set Phishing Module Path",
+    "Return to Main Menu",
+)
+_CONFIG_MENU_TEXT: Final = _format_menu(_CONFIG_MENU_OPTIONS, _CONFIG_OPTIONS_START)
+_CONFIG_RETURN_CHOICE: Final = _CONFIG_OPTIONS_START + len(_CONFIG_MENU_OPTIONS) - 1
+
+_PHISHING_MENU_OPTIONS: Final = (
+    "Execute Phishing Simulation",
+    "Check Prerequisites Only",
+    "Install Prerequisites",
+    "Cleanup After Simulation",
+    "Back to Custom Tests Menu",
+)
+_PHISHING_MENU_TEXT: Final = _format_menu(_PHISHING_MENU_OPTIONS)
+
+# Prompt choices, shared rather than rebuilt on every prompt
+_DETAIL_CHOICES: Final = ["B", "F"]
+_PLATFORM_CHOICES: Final = ["C", "A"]
+_PORT_ACTION_CHOICES: Final = ["0", "1", "2"]
+_NO_PORT_ACTION_CHOICES: Final = ["0", "1"]
+_YES_NO_CHOICES: Final = ["y", "n"]
+
+# Screen clearing writes this ANSI sequence; set PURPLE_CLI_NO_ANSI_CLEAR=1 on
+# terminals that don't understand it to fall back to the cls/clear command
+_ANSI_CLEAR: Final = "\x1b[2J\x1b[H"
+_NO_ANSI_CLEAR: Final = os.environ.get("PURPLE_CLI_NO_ANSI_CLEAR") == "1" or os.environ.get("TERM") == "dumb"
+
+# Directories already confirmed to exist by _is_valid_dir
+_VALID_DIRS: Set[str] = set()
+
+# Streamed command output beyond this many characters is shown but not kept in memory
+MAX_CAPTURED_OUTPUT_CHARS = 8 * 1024 * 1024
+# Ncrack output is printed as it arrives; only this many of its last lines are returned
+BRUTEFORCE_OUTPUT_TAIL_LINES = 500
+
+# Rows per page when picking a technique to run
+TECHNIQUE_PAGE_SIZE = 25
+
+# Columns of the technique, tactic and platform pickers after "#"
+_TECHNIQUE_PICK_COLUMNS: Final = (("Technique ID", "cyan"), ("Name", None))
+_TACTIC_PICK_COLUMNS: Final = (("Tactic Name", "green"),)
+_PLATFORM_PICK_COLUMNS: Final = (("Platform Name", "green"),)
+
+# Technique lists longer than this are printed as plain lines rather than a table
+PLAIN_TECHNIQUE_LIST_THRESHOLD = 100
+# Last rendered technique list as (title, technique list it was built from, table or text)
+_techniques_render: Optional[Tuple[str, Tuple[Tuple[str, Dict[str, Any]], ...], Any]] = None
+
+# Successful get_test_details output, keyed by (technique_id, show_details)
+TEST_DETAILS_CACHE: Dict[Tuple[str, bool], str] = {}
+
+# Output of previous test listings, keyed by _list_tests_cache_key().
+# Persisted to LIST_TESTS_CACHE_FILE in the config directory.
+LIST_TESTS_CACHE: Dict[str, str] = {}
+LIST_TESTS_CACHE_FILE = "list_tests_cache.json"
+LIST_TESTS_CACHE_MAX_ENTRIES = 32
+_list_tests_cache_loaded = False
+
+# Background worker used to prefetch data while the user reads a menu
+_bg = ThreadPoolExecutor(max_workers=2)
+# Unfinished _bg jobs; a process pool isn't started while there are any
+_bg_jobs: Set[Future] = set()
+_playbooks_future: Optional[Future] = None
+
+# Playbook list cache as (fetched_at, playbooks); stale entries are served
+# immediately while a refresh runs in the background
+_pb_cache: Optional[Tuple[float, List[Dict[str, str]]]] = None
+_playbook_cache: Dict[str, Any] = {}
+PLAYBOOK_CACHE_TTL = 30.0
+# Rendered playbook table as (playbook list it was built from, table)
+_pb_table: Optional[Tuple[List[Dict[str, str]], Any]] = None
+
+
+def _bg_submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """Runs fn(*args) on the background worker, tracking it in _bg_jobs until it finishes."""
+    future = _bg.submit(fn, *args)
+    _bg_jobs.add(future)
+    future.add_done_callback(_bg_jobs.discard)
+    return future
+
+
+def _load_playbooks() -> List[Dict[str, str]]:
+    """Import the playbook module on first use, fetch the playbook list and cache it."""
+    global _pb_cache
+    from purple_cli.core.playbook import get_available_playbooks
+
+    # Give every entry a name and description once so the menus can index them directly
+    playbooks = [
+        {"name": pb.get("name") or "Unknown", "description": pb.get("description", "")}
+        if isinstance(pb, dict) else {"name": str(pb) if pb else "Unknown", "description": ""}
+        for pb in get_available_playbooks() or []
+    ]
+    _pb_cache = (time.monotonic(), playbooks)
+    _playbook_cache.clear()
+    return playbooks
+
+
+def _prefetch_playbooks() -> None:
+    """Start fetching the playbook list in the background unless a fetch is already running."""
+    global _playbooks_future
+    if _playbooks_future is None or _playbooks_future.done():
+        _playbooks_future = _bg_submit(_load_playbooks)
+
+
+def _playbooks(ttl: float = PLAYBOOK_CACHE_TTL) -> List[Dict[str, str]]:
+    """
+    Return the playbook list from the cache.
+
+    On a cold cache this waits for the pending prefetch (or fetches directly).
+    Once older than ttl seconds, the cached list is still returned but a
+    background refresh is scheduled.
+    """
+    if _pb_cache is None:
+        if _playbooks_future is not None:
+            return _playbooks_future.result()
+        return _load_playbooks()
+
+    fetched_at, playbooks = _pb_cache
+    if time.monotonic() - fetched_at >= ttl:
+        _prefetch_playbooks()
+    return playbooks
+
+
+def _get_playbook(name: str) -> Any:
+    """Return a playbook by name, caching hits until the playbook list is refreshed."""
+    from purple_cli.core.playbook import get_playbook
+
+    playbook = _playbook_cache.get(name)
+    if playbook is None:
+        playbook = get_playbook(name)
+        if playbook is not None:
+            _playbook_cache[name] = playbook
+    return playbook
+
+
 def get_index_dir() -> Optional[Path]:
     """Gets the path to the Indexes directory within the configured atomics path."""
     config = get_config()
@@ -70,300 +371,790 @@ def get_index_dir() -> Optional[Path]:
         return None
     return index_dir
 
-def load_index_data() -> Tuple[List[str], Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]]:
+def _index_cache_path(index_file: Path) -> Path:
+    """Return the path of the parsed cache of one index file."""
+    name = hashlib.sha1(str(index_file).encode("utf-8")).hexdigest()[:16]
+    return get_config().config_path.parent / INDEX_CACHE_DIR / f"{name}.json"
+
+
+def _read_index_cache(index_file: Path, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
     """
-    Loads index data from YAML files for all platforms.
-    Returns the available platforms and the loaded index data with enhanced technique details.
-    Filters out techniques without atomic tests.
+    Return the cached parse of an index file if it matches (mtime_ns, size), else None.
+
+    The cache is plain JSON, so a tampered file can at worst give wrong
+    technique listings. Anything that doesn't have the expected shape is
+    treated as a cache miss.
     """
+    try:
+        with open(_index_cache_path(index_file), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != INDEX_CACHE_VERSION:
+        return None
+    if cached.get("path") != str(index_file) or cached.get("key") != list(key):
+        return None
+
+    # Rebuild the shared records and frozensets _parse_index_file produces
+    frozen_pool: Dict[FrozenSet[str], FrozenSet[str]] = {}
+    intern, pooled = sys.intern, frozen_pool.setdefault
+    try:
+        records = []
+        for name, platforms, phases, has_tests in cached["records"]:
+            if not (isinstance(name, str) and isinstance(has_tests, bool)):
+                return None
+            platform_set = frozenset(platforms)
+            phase_set = frozenset(phases)
+            if not all(isinstance(v, str) for v in platform_set | phase_set):
+                return None
+            platform_set = pooled(platform_set, platform_set)
+            phase_set = pooled(phase_set, phase_set)
+            records.append({
+                'name': name,
+                'platforms': platform_set,
+                'phases': phase_set,
+                'platforms_str': _format_platforms(platform_set),
+                'phases_str': _format_phases(phase_set),
+                'has_tests': has_tests,
+            })
+        return {
+            tactic: {intern(tech_id): records[row] for tech_id, row in techniques.items()}
+            for tactic, techniques in cached["tactics"].items()
+        }
+    except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _write_index_cache(index_file: Path, key: Tuple[int, int], data: Dict[str, Any]) -> None:
+    """Save the parse of an index file for the next start. Failures are ignored."""
+    # Records shared between tactics are written once and referenced by position
+    rows: Dict[int, int] = {}
+    records: List[List[Any]] = []
+    tactics: Dict[str, Dict[str, int]] = {}
+    for tactic, techniques in data.items():
+        tactic_rows = tactics[tactic] = {}
+        for tech_id, info in techniques.items():
+            row = rows.get(id(info))
+            if row is None:
+                row = rows[id(info)] = len(records)
+                records.append([info['name'], sorted(info['platforms']), sorted(info['phases']), info['has_tests']])
+            tactic_rows[tech_id] = row
+
+    cache_path = _index_cache_path(index_file)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": INDEX_CACHE_VERSION, "path": str(index_file), "key": list(key),
+                 "records": records, "tactics": tactics},
+                f, separators=(",", ":"),
+            )
+        # Drop the pickle an older version wrote for this index file
+        cache_path.with_suffix(".pkl").unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _index_file_key(index_file: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of an index file, or None if it can't be read."""
+    try:
+        stat = index_file.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Techniques share a few distinct platform/phase sets, so each is formatted once
+@lru_cache(maxsize=1024)
+def _format_platforms(platforms: FrozenSet[str]) -> str:
+    """Format a set of platforms for display, e.g. 'Linux, Windows'."""
+    return ", ".join(p.title() for p in sorted(platforms)) or "N/A"
+
+
+@lru_cache(maxsize=1024)
+def _format_phases(phases: FrozenSet[str]) -> str:
+    """Format a set of kill chain phases for display using the friendly tactic names."""
+    return ", ".join(TACTICS.get(p, p.title()) for p in sorted(phases)) or "N/A"
+
+
+def _yaml_loader() -> Any:
+    """Import yaml and return its fastest safe loader class."""
+    import yaml
+    # Use the libyaml C loader when available; it is much faster on the large index files
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_index_file(index_file: Path) -> Tuple[str, Optional[Dict[str, Dict[str, Dict[str, Any]]]], List[str]]:
+    """
+    Parses and normalizes a single platform index file.
+
+    Runs in a worker process, so warnings are returned rather than printed.
+
+    Args:
+        index_file: Path to a '<platform>-index.yaml' file.
+
+    Returns:
+        A tuple of (platform, normalized_data, warnings). The data is None if
+        the file was empty or couldn't be read.
+    """
+    import yaml
+
+    platform = _index_file_platform(index_file.name)
+    warnings: List[str] = []
+    loader = _yaml_loader()
+    try:
+        # Read bytes and let the YAML parser decode them; memory-map large files
+        with open(index_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > INDEX_MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = yaml.load(mm, Loader=loader)
+            else:
+                data = yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        return platform, None, [f"[yellow]Warning:[/yellow] Could not parse index file '{index_file.name}': {e}"]
+    except FileNotFoundError:
+        return platform, None, [f"[yellow]Warning:[/yellow] Index file not found: '{index_file.name}'"]
+    except IOError as e:
+        return platform, None, [f"[yellow]Warning:[/yellow] Could not read index file '{index_file.name}': {e}"]
+    if not data:
+        return platform, None, warnings
+
+    # Normalize tactic names (lowercase, replace space with hyphen) for consistency
+    normalized_platform_data = {}
+    frozen_pool: Dict[FrozenSet[str], FrozenSet[str]] = {}
+    # A technique is listed under each of its tactics with the same details;
+    # those listings share one (read-only) record instead of one dict each
+    records: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    # Bound once; these run for every technique entry
+    intern, lower_name, pooled, get_record = sys.intern, _lower_name, frozen_pool.setdefault, records.get
+    # Malformed technique entries are dropped here, so every kept record has all its
+    # fields and the lookup and display code doesn't need to check them again
+    skipped = 0
+    for tactic, techniques_in_tactic in data.items():
+        norm_tactic = _normalize_tactic(tactic)
+        
+        # Ensure techniques_in_tactic is a dictionary and validate its values
+        if isinstance(techniques_in_tactic, dict):
+            validated_techniques = {}
+            for tech_id, tech_value in techniques_in_tactic.items():
+                if not isinstance(tech_id, str):
+                    skipped += 1
+                    continue
+                tech_id = intern(tech_id) # IDs repeat across tactics and platforms
+                if isinstance(tech_value, dict):
+                    # Skip techniques without (or with empty) atomic tests
+                    if not tech_value.get('atomic_tests'):
+                        continue
+
+                    # Extract technique details; any missing field falls back to its default
+                    tech = tech_value.get('technique')
+                    if not isinstance(tech, dict):
+                        tech = {}
+                    platforms = tech.get('x_mitre_platforms')
+                    phases = tech.get('kill_chain_phases')
+                    platform_set = frozenset(lower_name(p) for p in platforms if isinstance(p, str)) if isinstance(platforms, list) else _EMPTY_SET
+                    phase_set = frozenset(
+                        lower_name(ph['phase_name']) for ph in phases
+                        if isinstance(ph, dict) and isinstance(ph.get('phase_name'), str)
+                    ) if isinstance(phases, list) else _EMPTY_SET
+                    # Most techniques share one of a few platform/phase combinations
+                    platform_set = pooled(platform_set, platform_set)
+                    phase_set = pooled(phase_set, phase_set)
+                    name = tech.get('name')
+                    if not isinstance(name, str):
+                        name = 'Unknown'
+                    record_key = (tech_id, name, platform_set, phase_set)
+                    record = get_record(record_key)
+                    if record is None:
+                        record = records[record_key] = {
+                            'name': name,
+                            'platforms': platform_set,
+                            'phases': phase_set,
+                            'platforms_str': _format_platforms(platform_set),
+                            'phases_str': _format_phases(phase_set),
+                            'has_tests': True  # We already know it has tests
+                        }
+                    validated_techniques[tech_id] = record
+                elif isinstance(tech_value, str):
+                    # Simple string case - create basic structure but mark as no tests
+                    record_key = (tech_id, tech_value)
+                    record = get_record(record_key)
+                    if record is None:
+                        record = records[record_key] = {
+                            'name': tech_value,
+                            'platforms': _EMPTY_SET,
+                            'phases': _EMPTY_SET,
+                            'platforms_str': "N/A",
+                            'phases_str': "N/A",
+                            'has_tests': False
+                        }
+                    validated_techniques[tech_id] = record
+                else:
+                    skipped += 1
+            normalized_platform_data[norm_tactic] = validated_techniques
+        else:
+            # Handle cases where techniques might not be a dict
+            warnings.append(f"[yellow]Warning:[/yellow] Invalid data format for tactic '{tactic}' in platform '{platform}'. Expected a dictionary of techniques.")
+            normalized_platform_data[norm_tactic] = {}
+
+    if skipped:
+        warnings.append(f"[yellow]Warning:[/yellow] Skipped {skipped} malformed technique entries in '{index_file.name}'.")
+    return platform, normalized_platform_data, warnings
+
+
+def _build_flat_index() -> None:
+    """Rebuild the flat row lists and reverse indexes from the loaded index data."""
+    idx = _IDX
+    tech_ids: List[str] = []
+    infos: List[Dict[str, Any]] = []
+    by_platform: Dict[str, Set[int]] = {}
+    by_tactic: Dict[str, Set[int]] = {}
+    platforms_by_tech: Dict[str, Set[str]] = {}
+    index_data = idx.data
+    for platform in idx.platforms:
+        for tactic, techniques in index_data.get(platform, {}).items():
+            for tech_id, tech_info in techniques.items():
+                row = len(tech_ids)
+                tech_ids.append(tech_id)
+                infos.append(tech_info)
+                by_platform.setdefault(platform, set()).add(row)
+                by_tactic.setdefault(tactic, set()).add(row)
+                platforms_by_tech.setdefault(tech_id, set()).add(platform)
+    idx.row_tech_ids, idx.row_infos, idx.by_platform, idx.by_tactic = tech_ids, infos, by_platform, by_tactic
+    idx.platforms_by_tech = platforms_by_tech
+
+
+def _discover_index_files() -> None:
+    """
+    Finds the platform index files without parsing them and resets the index data.
+    If the on-disk cache matches the files, all platforms are loaded from it.
+    """
+    idx = _IDX
+    idx.reset()
+    clear_index_lookup_caches()
+
     index_dir = get_index_dir()
     if not index_dir:
-        return [], {} # Return empty if index dir not found
-
-    local_available_platforms = []
-    loaded_data: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        return
 
-    console.print("[italic]Loading index data...[/italic]")
-    for index_file in index_dir.glob("*-index.yaml"):
-        platform_match = re.match(r"(.+)-index\.yaml", index_file.name)
-        if platform_match:
-            platform = platform_match.group(1).lower()
-            local_available_platforms.append(platform)
-            try:
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    if data:
-                        # Normalize tactic names (lowercase, replace space with hyphen) for consistency
-                        normalized_platform_data = {}
-                        for tactic, techniques_in_tactic in data.items():
-                            norm_tactic = tactic.lower().replace(' ', '-')
-                            
-                            # Ensure techniques_in_tactic is a dictionary and validate its values
-                            if isinstance(techniques_in_tactic, dict):
-                                validated_techniques = {}
-                                for tech_id, tech_value in techniques_in_tactic.items():
-                                    # Skip techniques without atomic tests
-                                    if isinstance(tech_value, dict) and 'atomic_tests' in tech_value:
-                                        if not tech_value['atomic_tests']:  # Skip if atomic_tests is empty
-                                            continue
-                                        
-                                        # Extract technique details
-                                        technique_info = {
-                                            'name': 'Unknown',  # Default name
-                                            'platforms': set(),
-                                            'phases': set(),
-                                            'has_tests': True  # We already know it has tests
-                                        }
-                                        
-                                        # Get technique name
-                                        if 'technique' in tech_value and isinstance(tech_value['technique'], dict):
-                                            if 'name' in tech_value['technique']:
-                                                technique_info['name'] = tech_value['technique']['name']
-                                                
-                                            # Extract platforms
-                                            if 'x_mitre_platforms' in tech_value['technique']:
-                                                platforms = tech_value['technique']['x_mitre_platforms']
-                                                if isinstance(platforms, list):
-                                                    technique_info['platforms'].update(p.lower() for p in platforms)
-                                            
-                                            # Extract kill chain phases
-                                            if 'kill_chain_phases' in tech_value['technique']:
-                                                phases = tech_value['technique']['kill_chain_phases']
-                                                if isinstance(phases, list):
-                                                    for phase in phases:
-                                                        if isinstance(phase, dict) and 'phase_name' in phase:
-                                                            technique_info['phases'].add(phase['phase_name'].lower())
-                                        
-                                        validated_techniques[tech_id] = technique_info
-                                    elif isinstance(tech_value, str):
-                                        # Simple string case - create basic structure but mark as no tests
-                                        validated_techniques[tech_id] = {
-                                            'name': tech_value,
-                                            'platforms': set(),
-                                            'phases': set(),
-                                            'has_tests': False
-                                        }
-                                normalized_platform_data[norm_tactic] = validated_techniques
-                            else:
-                                # Handle cases where techniques might not be a dict
-                                console.print(f"[yellow]Warning:[/yellow] Invalid data format for tactic '{tactic}' in platform '{platform}'. Expected a dictionary of techniques.")
-                                normalized_platform_data[norm_tactic] = {}
-
-                        loaded_data[platform] = normalized_platform_data
-            except yaml.YAMLError as e:
-                console.print(f"[yellow]Warning:[/yellow] Could not parse index file '{index_file.name}': {e}")
-            except FileNotFoundError:
-                console.print(f"[yellow]Warning:[/yellow] Index file not found: '{index_file.name}'")
-            except IOError as e:
-                console.print(f"[yellow]Warning:[/yellow] Could not read index file '{index_file.name}': {e}")
-
-    local_available_platforms.sort()
-    
-    # Update module-level cache after loading
-    global INDEX_DATA_CACHE, AVAILABLE_PLATFORMS
-    INDEX_DATA_CACHE = loaded_data
-    AVAILABLE_PLATFORMS = local_available_platforms
-
-    if not INDEX_DATA_CACHE:
+    # One scandir pass; entries carry their type, so only matching files become Paths
+    try:
+        with os.scandir(index_dir) as entries:
+            for entry in entries:
+                platform = _index_file_platform(entry.name)
+                if platform and entry.is_file():
+                    idx.files[platform] = Path(entry.path)
+    except OSError:
+        pass # Reported below as no index data
+    idx.platforms = sorted(idx.files)
+
+    if not idx.platforms:
         console.print("[bold red]Error:[/bold red] No valid index data could be loaded.")
         console.print("Please check the 'Indexes' directory in your atomics path.")
-         
-    return AVAILABLE_PLATFORMS, INDEX_DATA_CACHE
+        return
+
+
+def _ensure_platforms_loaded(platforms: List[str]) -> None:
+    """Parses the index files of any of the given platforms that aren't loaded yet."""
+    idx = _IDX
+    if idx.fully_parsed:
+        return
+    pending = [p for p in platforms if p not in idx.data and p in idx.files]
+    if not pending:
+        return
+
+    # Reuse files parsed before (this run or an earlier one) whose size and mtime are unchanged
+    to_parse: List[Tuple[Path, Optional[Tuple[int, int]]]] = []
+    for platform in pending:
+        index_file = idx.files[platform]
+        key = _index_file_key(index_file)
+        entry = idx.file_cache.get(str(index_file))
+        if key is not None and entry is not None and entry[:2] == key:
+            idx.file_cache.move_to_end(str(index_file))
+            idx.data[platform] = entry[2]
+            continue
+        platform_data = _read_index_cache(index_file, key) if key is not None else None
+        if platform_data is not None:
+            _remember_index_file(index_file, key, platform_data)
+            idx.data[platform] = platform_data
+        else:
+            to_parse.append((index_file, key))
+
+    if to_parse:
+        _parse_pending_index_files(to_parse)
+
+    _build_flat_index()
+    clear_index_lookup_caches()
+
+
+def _parse_pending_index_files(to_parse: List[Tuple[Path, Optional[Tuple[int, int]]]]) -> None:
+    """Parses the given (index file, stat key) pairs and saves the results to the index cache."""
+    idx = _IDX
+    console.print("[italic]Loading index data...[/italic]")
+    # Files already being parsed in the background are waited for rather than parsed again
+    prefetched = {str(f): idx.prefetch.pop(str(f)) for f, _ in to_parse if str(f) in idx.prefetch}
+    index_files = [index_file for index_file, _ in to_parse if str(index_file) not in prefetched]
+    total_bytes = sum(key[1] for f, key in to_parse if key is not None and str(f) not in prefetched)
+    if len(index_files) > 1 and total_bytes >= PARALLEL_PARSE_MIN_BYTES and not _bg_jobs:
+        # Index files are independent, so parse them on separate cores. Processes
+        # rather than threads: the YAML loader holds the GIL while building objects.
+        # Workers are spawned, not forked, since forking a process with running
+        # threads can leave the child stuck on a lock one of them held
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(index_files), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                parsed = list(pool.map(_parse_index_file, index_files))
+        except (OSError, BrokenProcessPool):
+            parsed = [_parse_index_file(f) for f in index_files]
+    else:
+        parsed = [_parse_index_file(f) for f in index_files]
+    parsed_by_path = dict(zip(map(str, index_files), parsed))
+    results = [
+        prefetched[str(f)].result() if str(f) in prefetched else parsed_by_path[str(f)]
+        for f, _ in to_parse
+    ]
+
+    for (platform, platform_data, warnings), (index_file, key) in zip(results, to_parse):
+        for warning in warnings:
+            console.print(warning)
+        # Empty or unreadable files are recorded as empty so they aren't retried this run
+        idx.data[platform] = platform_data or {}
+        if platform_data is not None and key is not None:
+            _remember_index_file(index_file, key, platform_data)
+            _write_index_cache(index_file, key, platform_data)
+
+
+def _has_cached_parse(index_file: Path) -> bool:
+    """True if an index file has a parse in memory, on disk or in progress (not checked for staleness)."""
+    path = str(index_file)
+    return path in _IDX.file_cache or path in _IDX.prefetch or _index_cache_path(index_file).exists()
+
+
+def _read_index_tactics(index_file: Path) -> Optional[Tuple[str, ...]]:
+    """
+    Reads the normalized tactic names (the top-level keys) of an index file.
+
+    Walks the YAML event stream without building the technique data, which is
+    most of the cost of a full parse.
+
+    Returns:
+        The sorted tactic names, or None if the file can't be read this way
+        (the full parse reports why).
+    """
+    import yaml
+
+    tactics: Set[str] = set()
+    depth, is_key = 0, True
+    try:
+        with open(index_file, 'rb') as f:
+            for event in yaml.parse(f, Loader=_yaml_loader()):
+                if isinstance(event, yaml.CollectionEndEvent):
+                    depth -= 1
+                    continue
+                if not isinstance(event, yaml.NodeEvent):
+                    continue # Stream and document events
+                if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                    return None
+                if depth == 1:
+                    # Nodes directly in the top-level mapping alternate key, value
+                    if is_key:
+                        if not isinstance(event, yaml.ScalarEvent):
+                            return None
+                        tactics.add(_normalize_tactic(event.value))
+                    is_key = not is_key
+                if isinstance(event, yaml.CollectionStartEvent):
+                    depth += 1
+    except (yaml.YAMLError, OSError):
+        return None
+    return tuple(sorted(tactics))
+
+
+def _remember_index_file(index_file: Path, key: Tuple[int, int], platform_data: Dict[str, Any]) -> None:
+    """Adds a parsed index file to the in-memory cache, evicting the least recently used."""
+    file_cache = _IDX.file_cache
+    file_cache[str(index_file)] = (*key, platform_data)
+    file_cache.move_to_end(str(index_file))
+    while len(file_cache) > INDEX_FILE_CACHE_MAX:
+        file_cache.popitem(last=False)
+
+
+def load_index_data() -> Tuple[Tuple[str, ...], Mapping[str, Dict[str, Dict[str, Dict[str, Any]]]]]:
+    """
+    Loads index data from YAML files for all platforms.
+    Returns the available platforms and a read-only view of the loaded index data
+    with enhanced technique details (no copy is made).
+    Filters out techniques without atomic tests.
+    """
+    _discover_index_files()
+    _ensure_platforms_loaded(_IDX.platforms)
+    return tuple(_IDX.platforms), MappingProxyType(_IDX.data)
 
 
 def ensure_index_data_loaded() -> None:
-    """Checks if index data is loaded, and loads it if not."""
-    if not INDEX_DATA_CACHE:
-        load_index_data()
+    """Finds the available platforms if not done yet. Platform data is parsed on first use."""
+    if not _IDX.loaded:
+        _discover_index_files()
 
 
-def get_techniques(platform: Optional[str] = None, tactic: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+@lru_cache(maxsize=512)
+def get_techniques(platform: Optional[str] = None, tactic: Optional[str] = None) -> Mapping[str, Dict[str, Any]]:
     """
     Retrieves techniques based on platform and/or tactic from the cached index data.
 
+    Results are memoized until the index data is reloaded.
+
     Args:
         platform: The platform name (e.g., 'windows', 'linux') or None for all.
         tactic: The tactic name (e.g., 'persistence') or None for all.
 
     Returns:
-        A dictionary of {technique_id: technique_info}.
+        A read-only mapping of {technique_id: technique_info}.
     """
     ensure_index_data_loaded() # Ensure data is loaded
-    results: Dict[str, Dict[str, Any]] = {}
-    
-    platforms_to_search = [platform] if platform else AVAILABLE_PLATFORMS
-
-    for p_key in platforms_to_search:
-        platform_data = INDEX_DATA_CACHE.get(p_key)
-        if not platform_data:
-            continue
+    idx = _IDX
+    _ensure_platforms_loaded([platform] if platform else idx.platforms)
 
-        tactics_to_search = [tactic] if tactic else platform_data.keys()
-        
-        for t_key in tactics_to_search:
-            # Normalize the requested tactic key for matching
-            norm_tactic_key = t_key.lower().replace(' ', '-')
-            techniques = platform_data.get(norm_tactic_key)
-            if techniques:
-                # Ensure techniques is a dictionary before processing
-                if isinstance(techniques, dict):
-                    # Only include techniques that have atomic tests
-                    for tech_id, tech_info in techniques.items():
-                        if tech_id not in results:
-                            results[tech_id] = tech_info
-                        elif isinstance(tech_info, dict) and isinstance(results[tech_id], dict):
-                            # If we already have this technique, merge platforms and phases
-                            if 'platforms' in tech_info and 'platforms' in results[tech_id]:
-                                results[tech_id]['platforms'].update(tech_info['platforms'])
-                            if 'phases' in tech_info and 'phases' in results[tech_id]:
-                                results[tech_id]['phases'].update(tech_info['phases'])
-                else:
-                    console.print(f"[yellow]Warning:[/yellow] Invalid technique data format for tactic '{t_key}' in platform '{p_key}'. Expected a dictionary.")
+    # A single platform and tactic is one table of the index; nothing to merge
+    if platform and tactic:
+        return MappingProxyType(idx.data.get(platform, {}).get(_normalize_tactic(tactic), {}))
 
-    return results
+    # Intersect the reverse indexes to find the matching rows
+    rows: Optional[Set[int]] = idx.by_platform.get(platform, set()) if platform else None
+    if tactic:
+        tactic_rows = idx.by_tactic.get(_normalize_tactic(tactic), set())
+        rows = tactic_rows if rows is None else rows & tactic_rows
 
-def get_tactics_for_platform(platform: str) -> List[str]:
-    """Gets a list of tactics available for a specific platform."""
+    results: Dict[str, Dict[str, Any]] = {}
+    merged: Set[str] = set()
+    row_tech_ids, row_infos = idx.row_tech_ids, idx.row_infos
+    for row in (range(len(row_tech_ids)) if rows is None else sorted(rows)):
+        tech_id, tech_info = row_tech_ids[row], row_infos[row]
+        existing = results.get(tech_id)
+        if existing is None:
+            results[tech_id] = tech_info
+            continue
+        # Seen on another platform. The platform and phase sets come from the
+        # technique itself, so they usually match and there is nothing to merge
+        platforms, phases = tech_info['platforms'], tech_info['phases']
+        if platforms <= existing['platforms'] and phases <= existing['phases']:
+            continue
+        # Merge into a copy, leaving the per-platform entries untouched
+        if tech_id not in merged:
+            merged.add(tech_id)
+            existing = results[tech_id] = dict(existing)
+        existing['platforms'] = existing['platforms'] | platforms
+        existing['phases'] = existing['phases'] | phases
+
+    # Refresh the display strings of merged entries
+    for tech_id in merged:
+        tech_info = results[tech_id]
+        tech_info['platforms_str'] = _format_platforms(tech_info['platforms'])
+        tech_info['phases_str'] = _format_phases(tech_info['phases'])
+
+    return MappingProxyType(results)
+
+@lru_cache(maxsize=512)
+def get_sorted_techniques(platform: Optional[str] = None, tactic: Optional[str] = None) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """Returns get_techniques(platform, tactic) as (technique_id, technique_info) pairs sorted by ID."""
+    return tuple(sorted(get_techniques(platform, tactic).items()))
+
+@lru_cache(maxsize=256)
+def get_tactics_for_platform(platform: str) -> Tuple[str, ...]:
+    """Gets the tactics available for a specific platform (memoized until the index is reloaded)."""
     ensure_index_data_loaded()
-    platform_data = INDEX_DATA_CACHE.get(platform.lower())
+    idx = _IDX
+    index_file = idx.files.get(platform.lower())
+    if index_file is not None and platform.lower() not in idx.data and not _has_cached_parse(index_file):
+        # Only the tactic names are needed to show the menu. Read just the top-level
+        # keys, and parse the whole file in the background while the user picks one
+        tactics = _read_index_tactics(index_file)
+        if tactics is not None:
+            idx.prefetch.setdefault(str(index_file), _bg_submit(_parse_index_file, index_file))
+            return tactics
+    _ensure_platforms_loaded([platform.lower()])
+    platform_data = _IDX.data.get(platform.lower())
     if platform_data:
         # Return the original tactic names used as keys in the index file if possible
         # We need to map back from the normalized keys used internally
-        return sorted(platform_data.keys())
-    return []
+        return tuple(sorted(platform_data.keys()))
+    return ()
 
-def get_all_tactics() -> List[str]:
-    """Gets a unique list of all tactics across all platforms."""
+def get_platforms_for_technique(technique_id: str) -> FrozenSet[str]:
+    """
+    Gets the already loaded platforms whose index lists a technique.
+
+    Platforms that haven't been parsed yet are not loaded for this, so the
+    result can miss platforms and is only a hint.
+
+    Args:
+        technique_id: The technique ID (e.g. 'T1003' or 't1053.005').
+
+    Returns:
+        The platform names, or an empty set if no loaded index lists the technique.
+    """
+    return frozenset(_IDX.platforms_by_tech.get(technique_id.upper(), ()))
+
+@lru_cache(maxsize=1)
+def get_all_tactics() -> Tuple[str, ...]:
+    """Gets the unique tactics across all platforms (memoized until the index is reloaded)."""
     ensure_index_data_loaded()
+    _ensure_platforms_loaded(_IDX.platforms)
     all_tactics = set()
-    for platform_data in INDEX_DATA_CACHE.values():
+    for platform_data in _IDX.data.values():
         all_tactics.update(platform_data.keys())
-    return sorted(list(all_tactics))
+    return tuple(sorted(all_tactics))
+
+
+@lru_cache(maxsize=64)
+def _sorted_display_tactics(tactics: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Map normalized tactic IDs to friendly names, sorted by friendly name."""
+    display = ((t_id, TACTICS.get(t_id, t_id.replace('-', ' ').title())) for t_id in tactics)
+    return tuple(sorted(display, key=lambda item: item[1]))
+
+
+def clear_index_lookup_caches() -> None:
+    """Forget memoized technique and tactic lookups, e.g. after the index data changes."""
+    get_techniques.cache_clear()
+    get_sorted_techniques.cache_clear()
+    get_tactics_for_platform.cache_clear()
+    get_all_tactics.cache_clear()
+    _sorted_display_tactics.cache_clear()
+
+
+def invalidate_atomics_caches() -> None:
+    """Drop the index data and every lookup or listing derived from the atomics folder."""
+    _IDX.reset()
+    clear_index_lookup_caches()
+    clear_list_tests_cache()
+    TEST_DETAILS_CACHE.clear()
 
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _NO_ANSI_CLEAR:
+        os.system('cls' if os.name == 'nt' else 'clear')
+    elif console.is_terminal:
+        # Write the ANSI clear + cursor-home sequence rather than spawning a process
+        console.file.write(_ANSI_CLEAR)
+        console.file.flush()
 
 
 def print_header(title: str) -> None:
     """Print a styled header with the given title."""
+    from rich.panel import Panel
+
     clear_screen()
-    console.print(Panel(f"[bold purple]{title}[/bold purple]", expand=False))
-    console.print("\n")
+    console.print(Panel(_HEADER_TMPL.format(title), expand=False), "\n")
+
+
+def _playbook_table(playbooks: List[Dict[str, str]]) -> Any:
+    """
+    Return the table listing the given playbooks.
+
+    The table is built once per playbook list and reused until the list is
+    refreshed, since the playbook menus are typically revisited many times.
+    """
+    global _pb_table
+    if _pb_table is not None and _pb_table[0] is playbooks:
+        return _pb_table[1]
+
+    from rich.table import Table
+
+    table = Table(title="Available Playbooks")
+    table.add_column("#", style="cyan", width=3)
+    table.add_column("Name", style="cyan")
+    table.add_column("Description")
+
+    for i, playbook in enumerate(playbooks, 1):
+        table.add_row(str(i), playbook["name"], playbook["description"])
+
+    _pb_table = (playbooks, table)
+    return table
+
+
+def _read_answer(prompt: str, default: Any, show_default: bool, choices: Optional[List[str]] = None) -> str:
+    """Print a prompt in one write and read one line from stdin (blank input gives the default)."""
+    suffix = ""
+    if choices:
+        suffix += f" [bold magenta]{markup.escape('[' + '/'.join(choices) + ']')}[/bold magenta]"
+    if show_default and default is not None and default != "":
+        suffix += f" [bold cyan]({markup.escape(str(default))})[/bold cyan]"
+    console.print(f"{prompt}{suffix}: ", end="")
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError # Same as input() when stdin is closed
+    answer = line.strip()
+    return str(default) if not answer and default is not None else answer
+
+
+def fast_prompt(
+    prompt: str,
+    default: Optional[str] = None,
+    choices: Optional[List[str]] = None,
+    show_choices: bool = True,
+    show_default: bool = True,
+) -> str:
+    """
+    Ask for a line of text. A lighter replacement for Prompt.ask.
+
+    The prompt is rendered once (Rich markup still works) and the answer is
+    read straight from stdin, skipping the extra flushes and writes Rich's
+    prompt makes on every call.
+
+    Args:
+        prompt: Prompt text, may contain Rich markup.
+        default: Returned when the user just presses Enter.
+        choices: If given, the answer must be one of these (case-insensitive).
+        show_choices: Whether to list the choices after the prompt.
+        show_default: Whether to show the default after the prompt.
+
+    Returns:
+        The stripped answer, or the matching entry from choices.
+    """
+    while True:
+        answer = _read_answer(prompt, default, show_default, choices if show_choices else None)
+        if not choices:
+            return answer
+        for choice in choices:
+            if choice.lower() == answer.lower():
+                return choice
+        console.print("[red]Please select one of the available options[/red]")
+
+
+def fast_int_prompt(prompt: str, default: Optional[int] = None, show_default: bool = True) -> int:
+    """Ask for an integer, re-prompting until one is entered. A lighter replacement for IntPrompt.ask."""
+    while True:
+        answer = _read_answer(prompt, default, show_default)
+        try:
+            return int(answer)
+        except ValueError:
+            console.print("[red]Please enter a valid integer number[/red]")
+
+
+def fast_confirm(prompt: str, default: bool = False) -> bool:
+    """Ask a yes/no question. A lighter replacement for Confirm.ask."""
+    return fast_prompt(prompt, default="y" if default else "n", choices=_YES_NO_CHOICES) == "y"
 
 
 def pause() -> None:
     """Wait for the user to press Enter to continue."""
     console.print("\n")
-    Prompt.ask("[italic]Press Enter to continue[/italic]")
+    fast_prompt("[italic]Press Enter to continue[/italic]", default="")
 
 
-def show_main_menu() -> str:
-    """Display the main menu and return the user's choice."""
+def show_main_menu() -> int:
+    """Display the main menu and return the user's choice (0 if invalid)."""
     print_header("Purple Team CLI - Interactive Mode")
+
+    # Fetch playbooks while the user is reading the menu
+    if _pb_cache is None:
+        _prefetch_playbooks()
     
-    options = [
-        "List Tests",
-        "Run Test",
-        "List Playbooks",
-        "Run Playbook",
-        "Help",
-        "Configuration",
-        "Exit"
-    ]
-    
-    for i, option in enumerate(options, 1):
-        console.print(f"[bold cyan]{i}.[/bold cyan] {option}")
-    
+    console.print(_MAIN_MENU_TEXT)
     console.print("\n")
     choice = IntPrompt.ask("Enter your choice", default=1)
     
-    if 1 <= choice <= len(options):
-        return options[choice-1]
-    return "Invalid"
+    if 1 <= choice <= len(_MAIN_MENU_OPTIONS):
+        return choice
+    return 0
 
 
 def list_tests_menu() -> None:
+    """
+    Run the list tests menu and its browse screens until the user backs out.
+
+    Each screen returns the next screen to show rather than calling it, so
+    navigating back and forth doesn't grow the call stack.
+    """
+    state: MenuState = ("list_tests", {})
+    while state:
+        screen, kwargs = state
+        state = _LIST_TESTS_SCREENS[screen](**kwargs)
+
+
+def _list_tests_screen() -> MenuState:
     """Display the list tests menu and options for filtering/browsing."""
     print_header("List Atomic Red Team Tests")
     ensure_index_data_loaded() # Ensure index is loaded before showing options
 
-    if not INDEX_DATA_CACHE:
+    if not _IDX.platforms:
         console.print("[bold red]Could not load test index data. Cannot browse.[/bold red]")
         pause()
-        return
-
-    options = [
-        "Search by keyword or technique ID",
-        "Browse by Tactic",
-        "Browse by Platform",
-        "Show All Tests (using Invoke-AtomicTest)",
-        "Back to Main Menu"
-    ]
+        return None
 
-    for i, option in enumerate(options, 1):
-        console.print(f"[bold cyan]{i}.[/bold cyan] {option}")
+    console.print(_LIST_TESTS_MENU_TEXT)
     console.print("\n")
 
     choice = IntPrompt.ask("Enter your choice", default=1)
 
-    if choice == 1:
-        # Search by keyword or technique ID (using Invoke-AtomicTest)
+    handler = _LIST_TESTS_DISPATCH.get(choice)
+    if handler is None:
+        console.print("[bold red]Invalid choice.[/bold red]")
+        pause()
+        return ("list_tests", {})
+    return handler()
+
+
+def _search_tests() -> MenuState:
+    """Search tests by keyword or technique ID (using Invoke-AtomicTest)."""
+    raw = Prompt.ask(
+        "Search term or technique ID [platform=C|A] [detail=B|F] (e.g., T1003 platform=A), or ? for step-by-step",
+        default=""
+    ).strip()
+    if raw == "?":
         filter_option = Prompt.ask(
             "Enter a search term or technique ID (e.g., T1003 or credential)",
             default=""
         )
         show_filtered_tests_powershell(filter_option)
-    elif choice == 2:
-        # Browse by Tactic (using index data)
-        browse_by_tactic()
-    elif choice == 3:
-        # Browse by Platform (using index data)
-        browse_by_platform()
-    elif choice == 4:
-        # Show All Tests (using Invoke-AtomicTest)
-        # Corrected indentation
-        if Confirm.ask("Showing all tests via PowerShell can take time. Continue?", default=True):
-            # Corrected indentation
-            show_filtered_tests_powershell(None) # None filter means show all
-        else:
-            # Corrected indentation
-            list_tests_menu() # Go back
-    elif choice == 5:
-        return # Back to main menu
-    else:
-        console.print("[bold red]Invalid choice.[/bold red]")
+        return ("list_tests", {})
+    try:
+        filter_option, show_details, any_os = _parse_search_options(raw)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {markup.escape(str(e))}")
         pause()
-        list_tests_menu()
+        return ("list_tests", {})
+    show_filtered_tests_powershell(filter_option, show_details=show_details, any_os=any_os)
+    return ("list_tests", {})
+
+
+def _show_all_tests() -> MenuState:
+    """Show all tests (using Invoke-AtomicTest) after confirming."""
+    if Confirm.ask("Showing all tests via PowerShell can take time. Continue?", default=True):
+        show_filtered_tests_powershell(None) # None filter means show all
+    return ("list_tests", {}) # Go back
 
 
-def browse_by_tactic() -> None:
+def browse_by_tactic() -> MenuState:
     """Display tactics and allow filtering techniques by tactic and platform."""
+    from rich.table import Table
+
     print_header("Browse Tests by Tactic")
     all_tactics = get_all_tactics()
 
     if not all_tactics:
         console.print("[bold red]No tactics found in index data.[/bold red]")
         pause()
-        return
+        return None
 
     table = Table(title="MITRE ATT&CK Tactics")
     table.add_column("#", style="cyan", width=3)
     table.add_column("Tactic Name", style="green")
 
-    # Map normalized tactic IDs back to friendly names if possible
-    tactic_display_map = {t_id: TACTICS.get(t_id, t_id.replace('-', ' ').title()) for t_id in all_tactics}
-    
-    # Sort by display name
-    sorted_display_tactics = sorted(tactic_display_map.items(), key=lambda item: item[1])
+    # (tactic_id, friendly name) pairs sorted by friendly name
+    sorted_display_tactics = _sorted_display_tactics(all_tactics)
 
     # Use _tactic_id as it's not used in the loop body
     for i, (_tactic_id, tactic_name) in enumerate(sorted_display_tactics, 1):
         table.add_row(str(i), tactic_name)
 
-    console.print(table)
-    console.print("\n")
+    console.print(table, "\n")
 
     tactic_choice_num = IntPrompt.ask(
         "Select a tactic number to view related techniques (0 to go back)",
@@ -374,10 +1165,10 @@ def browse_by_tactic() -> None:
         selected_tactic_id, selected_tactic_name = sorted_display_tactics[tactic_choice_num - 1]
 
         # Ask for platform
-        platform_options = ["All"] + AVAILABLE_PLATFORMS
-        console.print("\n[bold]Filter by platform:[/bold]")
-        for i, plat in enumerate(platform_options, 1):
-            console.print(f"[bold cyan]{i}.[/bold cyan] {plat.title()}")
+        platform_options = ["All"] + _IDX.platforms
+        console.print("\n[bold]Filter by platform:[/bold]\n" + "\n".join(
+            f"[bold cyan]{i}.[/bold cyan] {plat.title()}" for i, plat in enumerate(platform_options, 1)
+        ))
         
         platform_choice_num = IntPrompt.ask("Select platform", default=1)
 
@@ -390,44 +1181,47 @@ def browse_by_tactic() -> None:
                 # Corrected indentation
                 selected_platform = selected_platform_name.lower() # Use lowercase platform ID
 
-        show_techniques_for_tactic(selected_tactic_id, selected_tactic_name, selected_platform)
-    else:
-        list_tests_menu() # Go back
+        return ("techniques_for_tactic", {
+            "tactic_id": selected_tactic_id, "tactic_name": selected_tactic_name, "platform": selected_platform,
+        })
+    return ("list_tests", {}) # Go back
 
 
-def browse_by_platform() -> None:
+def browse_by_platform() -> MenuState:
     """Display platforms and allow filtering techniques by platform and tactic."""
+    from rich.table import Table
+
     print_header("Browse Tests by Platform")
 
-    if not AVAILABLE_PLATFORMS:
+    if not _IDX.platforms:
         console.print("[bold red]No platforms found in index data.[/bold red]")
         pause()
-        return
+        return None
 
     table = Table(title="Available Platforms")
     table.add_column("#", style="cyan", width=3)
     table.add_column("Platform Name", style="green")
 
-    for i, platform_name in enumerate(AVAILABLE_PLATFORMS, 1):
+    for i, platform_name in enumerate(_IDX.platforms, 1):
         table.add_row(str(i), platform_name.title()) # Display title case
 
-    console.print(table)
-    console.print("\n")
+    console.print(table, "\n")
 
     platform_choice_num = IntPrompt.ask(
         "Select a platform number to view its tactics (0 to go back)",
         default=0
     )
 
-    if 0 < platform_choice_num <= len(AVAILABLE_PLATFORMS):
-        selected_platform = AVAILABLE_PLATFORMS[platform_choice_num - 1]
-        show_tactics_for_platform(selected_platform)
-    else:
-        list_tests_menu() # Go back
+    if 0 < platform_choice_num <= len(_IDX.platforms):
+        selected_platform = _IDX.platforms[platform_choice_num - 1]
+        return ("tactics_for_platform", {"platform": selected_platform})
+    return ("list_tests", {}) # Go back
 
 
-def show_tactics_for_platform(platform: str) -> None:
+def show_tactics_for_platform(platform: str) -> MenuState:
     """Show tactics available for a specific platform."""
+    from rich.table import Table
+
     print_header(f"Tactics for Platform: {platform.title()}")
     
     tactics = get_tactics_for_platform(platform)
@@ -435,23 +1229,20 @@ def show_tactics_for_platform(platform: str) -> None:
     if not tactics:
         console.print(f"[yellow]No tactics found for platform '{platform}'.[/yellow]")
         pause()
-        browse_by_platform() # Go back to platform selection
-        return
+        return ("browse_by_platform", {}) # Go back to platform selection
 
     table = Table(title=f"Tactics on {platform.title()}")
     table.add_column("#", style="cyan", width=3)
     table.add_column("Tactic Name", style="green")
 
-    # Map normalized tactic IDs back to friendly names if possible
-    tactic_display_map = {t_id: TACTICS.get(t_id, t_id.replace('-', ' ').title()) for t_id in tactics}
-    sorted_display_tactics = sorted(tactic_display_map.items(), key=lambda item: item[1])
+    # (tactic_id, friendly name) pairs sorted by friendly name
+    sorted_display_tactics = _sorted_display_tactics(tactics)
 
     # Use _tactic_id as it's not used in the loop body
     for i, (_tactic_id, tactic_name) in enumerate(sorted_display_tactics, 1):
         table.add_row(str(i), tactic_name)
 
-    console.print(table)
-    console.print("\n")
+    console.print(table, "\n")
 
     tactic_choice_num = IntPrompt.ask(
         "Select a tactic number to view its techniques (0 to go back)",
@@ -460,12 +1251,63 @@ def show_tactics_for_platform(platform: str) -> None:
 
     if 0 < tactic_choice_num <= len(sorted_display_tactics):
         selected_tactic_id, selected_tactic_name = sorted_display_tactics[tactic_choice_num - 1]
-        show_techniques_for_platform_tactic(platform, selected_tactic_id, selected_tactic_name)
+        return ("techniques_for_platform_tactic", {
+            "platform": platform, "tactic_id": selected_tactic_id, "tactic_name": selected_tactic_name,
+        })
+    return ("browse_by_platform", {}) # Go back to platform selection
+
+
+def _print_techniques_table(title: str, sorted_techniques: Tuple[Tuple[str, Dict[str, Any]], ...]) -> None:
+    """
+    Print a numbered table of techniques.
+
+    Columns are sized up front so Rich can skip most of its measuring pass.
+    Lists longer than PLAIN_TECHNIQUE_LIST_THRESHOLD are written as plain
+    aligned lines instead, since laying out hundreds of table rows is slow.
+    The last list is kept, so going back to it after viewing a technique
+    doesn't rebuild it.
+
+    Args:
+        title: Title shown above the table.
+        sorted_techniques: (technique_id, technique_info) pairs in display order.
+    """
+    global _techniques_render
+    if _techniques_render is None or _techniques_render[0] != title or _techniques_render[1] is not sorted_techniques:
+        _techniques_render = (title, sorted_techniques, _render_techniques(title, sorted_techniques))
+    rendered = _techniques_render[2]
+    if isinstance(rendered, str):
+        console.out(rendered, highlight=False)
     else:
-        browse_by_platform() # Go back to platform selection
+        console.print(rendered, soft_wrap=False)
+
+
+def _render_techniques(title: str, sorted_techniques: Tuple[Tuple[str, Dict[str, Any]], ...]) -> Any:
+    """Build the table (or, for long lists, the plain text) printed by _print_techniques_table."""
+    if len(sorted_techniques) > PLAIN_TECHNIQUE_LIST_THRESHOLD:
+        lines = [title, ""]
+        lines.extend(
+            f"{i:>4}  {tech_id:<10} {tech_info['name']}"
+            f"  [{tech_info['platforms_str']}] [{tech_info['phases_str']}]"
+            for i, (tech_id, tech_info) in enumerate(sorted_techniques, 1)
+        )
+        return "\n".join(lines)
+
+    from rich.table import Table
+
+    table = Table(title=title, pad_edge=False, collapse_padding=True)
+    table.add_column("#", style="cyan", width=4, no_wrap=True)
+    table.add_column("Technique ID", style="cyan", width=12, no_wrap=True)
+    table.add_column("Name", overflow="fold", max_width=60)
+    table.add_column("Platforms", style="green")
+    table.add_column("Tactics", style="yellow")
+
+    add_row = table.add_row
+    for i, (tech_id, tech_info) in enumerate(sorted_techniques, 1):
+        add_row(str(i), tech_id, tech_info['name'], tech_info['platforms_str'], tech_info['phases_str'])
+    return table
 
 
-def show_techniques_for_platform_tactic(platform: str, tactic_id: str, tactic_name: str) -> None:
+def show_techniques_for_platform_tactic(platform: str, tactic_id: str, tactic_name: str) -> MenuState:
     """Show techniques for a specific platform and tactic using index data with enhanced details."""
     title = f"Techniques for Tactic '{tactic_name}' on Platform '{platform.title()}'"
     print_header(title)
@@ -475,40 +1317,18 @@ def show_techniques_for_platform_tactic(platform: str, tactic_id: str, tactic_na
     if not techniques:
         console.print("[yellow]No techniques found for this platform/tactic combination.[/yellow]")
         pause()
-        show_tactics_for_platform(platform) # Go back to tactic selection for this platform
-        return
+        return ("tactics_for_platform", {"platform": platform}) # Go back to tactic selection for this platform
 
-    table = Table(title=title)
-    table.add_column("#", style="cyan", width=3)
-    table.add_column("Technique ID", style="cyan")
-    table.add_column("Name")
-    table.add_column("Platforms", style="green")
-    table.add_column("Tactics", style="yellow")
-
-    # Sort by technique ID
-    sorted_techniques = sorted(techniques.items())
-
-    for i, (tech_id, tech_info) in enumerate(sorted_techniques, 1):
-        # Format platforms list
-        platforms_list = list(tech_info.get('platforms', set()))
-        platforms_str = ", ".join([p.title() for p in sorted(platforms_list)]) if platforms_list else "N/A"
-        
-        # Format tactics list
-        phases_list = list(tech_info.get('phases', set()))
-        phases_str = ", ".join([TACTICS.get(p, p.title()) for p in sorted(phases_list)]) if phases_list else "N/A"
-        
-        table.add_row(str(i), tech_id, tech_info.get('name', 'Unknown'), platforms_str, phases_str)
-
-    console.print(table)
+    # Sorted by technique ID; platform and tactic strings are formatted at load time
+    sorted_techniques = get_sorted_techniques(platform, tactic_id)
+    _print_techniques_table(title, sorted_techniques)
     console.print(f"\n[bold]Found {len(sorted_techniques)} techniques with atomic tests.[/bold]")
 
-    handle_technique_details_prompt(
-        go_back_func=lambda: show_tactics_for_platform(platform), # Go back to tactic list for this platform
-        techniques=techniques
-    )
+    handle_technique_details_prompt(sorted_techniques)
+    return ("tactics_for_platform", {"platform": platform}) # Go back to tactic list for this platform
 
 
-def show_techniques_for_tactic(tactic_id: str, tactic_name: str, platform: Optional[str] = None) -> None:
+def show_techniques_for_tactic(tactic_id: str, tactic_name: str, platform: Optional[str] = None) -> MenuState:
     """Show techniques for a specific tactic, optionally filtered by platform, using index data."""
     platform_filter_desc = f"on Platform '{platform.title()}'" if platform else "across All Platforms"
     title = f"Techniques for Tactic '{tactic_name}' {platform_filter_desc}"
@@ -519,64 +1339,51 @@ def show_techniques_for_tactic(tactic_id: str, tactic_name: str, platform: Optio
     if not techniques:
         console.print(f"[yellow]No techniques found for this tactic {platform_filter_desc}.[/yellow]")
         pause()
-        browse_by_tactic() # Go back to tactic selection
-        return
+        return ("browse_by_tactic", {}) # Go back to tactic selection
 
-    table = Table(title=title)
-    table.add_column("#", style="cyan", width=3)
-    table.add_column("Technique ID", style="cyan")
-    table.add_column("Name")
-    table.add_column("Platforms", style="green")
-    table.add_column("Tactics", style="yellow")
+    # Sorted by technique ID; platform and tactic strings are formatted at load time
+    sorted_techniques = get_sorted_techniques(platform, tactic_id)
+    _print_techniques_table(title, sorted_techniques)
+    console.print(f"\n[bold]Found {len(sorted_techniques)} techniques with atomic tests.[/bold]")
 
-    # Sort by technique ID
-    sorted_techniques = sorted(techniques.items())
-    
-    for i, (tech_id, tech_info) in enumerate(sorted_techniques, 1):
-        # Format platforms list
-        platforms_list = list(tech_info.get('platforms', set()))
-        platforms_str = ", ".join([p.title() for p in sorted(platforms_list)]) if platforms_list else "N/A"
-        
-        # Format tactics list
-        phases_list = list(tech_info.get('phases', set()))
-        phases_str = ", ".join([TACTICS.get(p, p.title()) for p in sorted(phases_list)]) if phases_list else "N/A"
-        
-        table.add_row(str(i), tech_id, tech_info.get('name', 'Unknown'), platforms_str, phases_str)
+    handle_technique_details_prompt(sorted_techniques)
+    return ("browse_by_tactic", {}) # Go back to tactic selection
 
-    console.print(table)
-    console.print(f"\n[bold]Found {len(sorted_techniques)} techniques with atomic tests.[/bold]")
 
-    handle_technique_details_prompt(
-        go_back_func=browse_by_tactic, # Go back to tactic selection
-        techniques=techniques
-    )
+def _get_test_details_cached(technique_id: str, show_details: bool) -> Tuple[bool, str]:
+    """Calls get_test_details, reusing successful results for the rest of the session."""
+    key = (technique_id.upper(), show_details)
+    details = TEST_DETAILS_CACHE.get(key)
+    if details is not None:
+        return True, details
+    success, details = get_test_details(technique_id, show_details=show_details)
+    if success: # Errors such as timeouts are retried next time
+        TEST_DETAILS_CACHE[key] = details
+    return success, details
 
 
-def handle_technique_details_prompt(go_back_func: Callable[[], None], techniques: Dict[str, Dict[str, Any]] = None) -> None:
+def handle_technique_details_prompt(sorted_techniques: Tuple[Tuple[str, Dict[str, Any]], ...] = ()) -> None:
     """
     Prompts user to enter a technique ID or index number for details or go back.
+    Returns once the user goes back; the caller decides which screen to show next.
     
     Args:
-        go_back_func: Function to call when going back to previous menu
-        techniques: Dictionary of techniques with keys as technique IDs, values as technique info
+        sorted_techniques: (technique_id, technique_info) pairs in the order they were displayed
     """
     # Create a mapping of index numbers to technique IDs if techniques are provided
     technique_mapping = {}
-    if techniques:
-        # Get the sorted list of technique IDs that was displayed to the user
-        sorted_tech_ids = sorted(techniques.keys())
+    if sorted_techniques:
         # Create a mapping from index (1-based) to technique ID
-        technique_mapping = {str(i): tech_id for i, tech_id in enumerate(sorted_tech_ids, 1)}
+        technique_mapping = {str(i): tech_id for i, (tech_id, _tech_info) in enumerate(sorted_techniques, 1)}
         
-        prompt_text = "\nEnter a technique number (1-{}) or ID to view details (using PowerShell), or press Enter to go back".format(len(sorted_tech_ids))
+        prompt_text = "\nEnter a technique number (1-{}) or ID to view details (using PowerShell), or press Enter to go back".format(len(sorted_techniques))
     else:
         prompt_text = "\nEnter a technique ID to view details (using PowerShell), or press Enter to go back"
     
     user_input = Prompt.ask(prompt_text, default="").strip()
     
     if not user_input:
-        go_back_func()  # Go back if input is empty
-        return
+        return  # Go back if input is empty
     
     # Check if the input is a number and maps to a technique
     technique_id = None
@@ -585,297 +1392,397 @@ def handle_technique_details_prompt(go_back_func: Callable[[], None], techniques
         console.print(f"[italic]Selected technique {technique_id} at index {user_input}[/italic]")
     else:
         # Assume it's a technique ID and validate format
-        if re.match(r"^T\d{4}(\.\d{3})?$", user_input, re.IGNORECASE):
-            technique_id = user_input
+        if _TECHNIQUE_ID_RE.match(user_input):
+            technique_id = user_input.upper()
         else:
             console.print("[bold red]Invalid Technique ID format or index number.[/bold red] Example: T1003 or T1053.005")
             pause()
-            go_back_func()  # Go back
-            return
+            return  # Go back
+        # Hint at typos using the platforms loaded so far; the index can lag behind the
+        # atomics folder, so details are still fetched
+        if _IDX.data and not get_platforms_for_technique(technique_id):
+            console.print(f"[yellow]Warning: Technique {technique_id} is not listed in the loaded atomics index.[/yellow]")
     
     print_header(f"Details for Technique: {technique_id}")
     console.print("[italic]Fetching details using PowerShell...[/italic]")
     # Use the PowerShell command for details
-    success, details = get_test_details(technique_id, show_details=True)  # Show full details
+    success, details = _get_test_details_cached(technique_id, show_details=True)  # Show full details
     if success:
         console.print(details)
     else:
         console.print(f"[bold red]Error fetching details:[/bold red] {details}")
     pause()
-    go_back_func()  # Go back to the previous technique list view
 
 
 # Remove the old get_techniques_by_tactic function that parsed individual files
 # def get_techniques_by_tactic(tactic_id: str) -> List[str]: ...
 
 
-def show_filtered_tests_powershell(filter_str: Optional[str] = None) -> None:
-    """Show filtered test results based on a search string using PowerShell."""
-    # Determine detail level
-    detail_level = Prompt.ask(
-        "Display: [B]rief details or [F]ull details",
-        choices=["B", "F"],
-        default="B"
-    )
-    show_details = detail_level.upper() == "F"
+def _list_tests_cache_path() -> Path:
+    """Return the path of the on-disk test listing cache."""
+    return get_config().config_path.parent / LIST_TESTS_CACHE_FILE
 
-    # Ask about platform filtering
-    platform_option = Prompt.ask(
-        "Show tests for: [C]urrent platform only or [A]ll platforms",
-        choices=["C", "A"],
-        default="C"
-    )
-    any_os = platform_option.upper() == "A"
-
-    console.print("\n[bold yellow]Fetching available tests via PowerShell...[/bold yellow]")
-
-    # Build the PowerShell command using the executor's build_command
-    # We need the command list, not the direct execution result from list_available_tests
-    command_list = build_command(
-        technique_id=filter_str if filter_str else "All",
-        show_details=show_details,
-        show_details_brief=not show_details,
-        any_os=any_os,
-        # Flags not relevant for listing details:
-        test_numbers=None,
-        check_prereqs=False,
-        get_prereqs=False,
-        cleanup=False,
-        session=None,
-    )
 
-    # Execute the command
-    success, result = execute_ps_command(command_list)
+def _list_tests_cache_key(filter_str: Optional[str], show_details: bool, any_os: bool) -> str:
+    """
+    Build the cache key for a test listing.
 
-    if success:
-        console.print(result)
+    The atomics path and its modification time are part of the key, so
+    listings are refetched when the atomics folder changes.
+    """
+    atomics_path = get_config().atomics_path or ""
+    try:
+        mtime = Path(atomics_path).stat().st_mtime_ns if atomics_path else 0
+    except OSError:
+        mtime = 0
+    return json.dumps([filter_str or "All", show_details, any_os, atomics_path, mtime])
+
+
+def _load_list_tests_cache() -> None:
+    """Load the on-disk test listing cache into memory once."""
+    global _list_tests_cache_loaded
+    if _list_tests_cache_loaded:
+        return
+    _list_tests_cache_loaded = True
+    try:
+        with open(_list_tests_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(data, dict):
+        LIST_TESTS_CACHE.update({k: v for k, v in data.items() if isinstance(v, str)})
+
+
+def _store_list_tests_output(key: str, output: str) -> None:
+    """Cache a test listing in memory and on disk, evicting the oldest entries."""
+    LIST_TESTS_CACHE.pop(key, None)
+    LIST_TESTS_CACHE[key] = output
+    while len(LIST_TESTS_CACHE) > LIST_TESTS_CACHE_MAX_ENTRIES:
+        del LIST_TESTS_CACHE[next(iter(LIST_TESTS_CACHE))]
+    try:
+        with open(_list_tests_cache_path(), "w", encoding="utf-8") as f:
+            json.dump(LIST_TESTS_CACHE, f)
+    except OSError:
+        pass # The in-memory cache still works
+
+
+def clear_list_tests_cache() -> None:
+    """Forget all cached test listings, in memory and on disk."""
+    LIST_TESTS_CACHE.clear()
+    try:
+        _list_tests_cache_path().unlink()
+    except OSError:
+        pass
+
+
+def _parse_search_options(raw: str) -> Tuple[str, bool, bool]:
+    """
+    Parse a one-line search such as 'credential platform=A detail=F'.
+
+    Args:
+        raw: The user's input. Plain words form the search term; the optional
+             platform=C|A and detail=B|F options default to C and B.
+
+    Returns:
+        A tuple of (search_term, show_details, any_os).
+
+    Raises:
+        ValueError: If the input can't be tokenised or has an unknown option.
+    """
+    terms: List[str] = []
+    options = {"platform": "C", "detail": "B"}
+    for token in shlex.split(raw):
+        key, sep, value = token.partition("=")
+        if not sep:
+            terms.append(token)
+            continue
+        key, value = key.lower(), value.upper()
+        if key == "platform" and value in _PLATFORM_CHOICES:
+            options[key] = value
+        elif key == "detail" and value in _DETAIL_CHOICES:
+            options[key] = value
+        else:
+            raise ValueError(f"Unknown option '{token}'. Use platform=C|A and detail=B|F.")
+    return " ".join(terms), options["detail"] == "F", options["platform"] == "A"
+
+
+def show_filtered_tests_powershell(
+    filter_str: Optional[str] = None,
+    show_details: Optional[bool] = None,
+    any_os: Optional[bool] = None,
+) -> None:
+    """
+    Show filtered test results based on a search string using PowerShell.
+
+    Args:
+        filter_str: Search term or technique ID. Shows all tests if empty.
+        show_details: Whether to show full details. Prompted for if None.
+        any_os: Whether to include all platforms. Prompted for if None.
+    """
+    if show_details is None:
+        # Determine detail level
+        detail_level = Prompt.ask(
+            "Display: [B]rief details or [F]ull details",
+            choices=_DETAIL_CHOICES,
+            show_choices=False,
+            default="B"
+        )
+        show_details = detail_level.upper() == "F"
+
+    if any_os is None:
+        # Ask about platform filtering
+        platform_option = Prompt.ask(
+            "Show tests for: [C]urrent platform only or [A]ll platforms",
+            choices=_PLATFORM_CHOICES,
+            show_choices=False,
+            default="C"
+        )
+        any_os = platform_option.upper() == "A"
+
+    _load_list_tests_cache()
+    cache_key = _list_tests_cache_key(filter_str, show_details, any_os)
+    cached_output = LIST_TESTS_CACHE.get(cache_key)
+
+    if cached_output is not None:
+        console.print("[dim](cached result)[/dim]")
+        console.print(cached_output, end="", markup=False)
     else:
-        console.print(f"[bold red]Error executing PowerShell command:[/bold red]\n{result}")
+        console.print("\n[bold yellow]Fetching available tests via PowerShell...[/bold yellow]")
+        # The filter is passed as a quoted argument rather than spliced into the script;
+        # the command is only built when PowerShell actually has to run
+        command_list = build_list_tests_command(filter_str, show_details=show_details, any_os=any_os)
+        # Execute the command (output is streamed to the console as it arrives)
+        success, result = execute_ps_command(command_list)
+
+        if success:
+            if result is not None: # Listings too large to keep are simply not cached
+                _store_list_tests_output(cache_key, result)
+        else:
+            console.print(f"[bold red]Error executing PowerShell command:[/bold red]\n{result}")
 
     pause()
-    list_tests_menu() # Go back to list tests menu
+
+
+def _invalid_choice() -> None:
+    """Tell the user their menu choice was invalid."""
+    console.print("[bold red]Invalid choice.[/bold red]")
+    pause()
+
+
+def _paged_select(
+    title: str,
+    columns: Tuple[Tuple[str, Optional[str]], ...],
+    rows: List[Tuple[str, ...]],
+    item_name: str,
+    page_size: int = TECHNIQUE_PAGE_SIZE,
+) -> Optional[int]:
+    """
+    Show rows as a numbered table one page at a time and let the user pick one.
+
+    Only the visible page is added to the table, so long lists don't pay
+    Rich's layout cost for rows the user never sees.
+
+    Args:
+        title: Table title.
+        columns: (header, style) for each column after the "#" column.
+        rows: Cell values for each row, in display order.
+        item_name: What a row is, used in the prompt (e.g. "technique").
+        page_size: Rows per page.
+
+    Returns:
+        The 0-based index of the chosen row, or None if the user enters 0 to go back.
+        Any other answer that isn't a row number or page command asks again.
+    """
+    from rich.table import Table
+
+    page_count = max(1, -(-len(rows) // page_size))
+    page = 0
+    while True:
+        start = page * page_size
+        table = Table(title=title if page_count == 1 else f"{title} (page {page + 1}/{page_count})")
+        table.add_column("#", style="cyan", width=4)
+        for header, style in columns:
+            table.add_column(header, style=style)
+        for i, row in enumerate(rows[start:start + page_size], start + 1):
+            table.add_row(str(i), *row)
+        console.print(table)
+
+        if page_count == 1:
+            prompt_text = f"\nSelect a {item_name} number (0 to go back)"
+        else:
+            prompt_text = f"\nSelect a {item_name} number, [N]ext or [P]revious page (0 to go back)"
+        answer = Prompt.ask(prompt_text).strip().upper()
+
+        if answer == "0":
+            return None  # Go back
+        if answer == "N":
+            page = min(page + 1, page_count - 1)
+        elif answer == "P":
+            page = max(page - 1, 0)
+        elif answer.isdigit() and 0 < int(answer) <= len(rows):
+            return int(answer) - 1
+        else:
+            console.print("[bold red]Invalid choice.[/bold red]")
+
+
+def _pick_tactic(tactics: Tuple[str, ...], title: str) -> Optional[Tuple[str, str]]:
+    """Let the user pick one of the given tactics. Returns (tactic_id, friendly name), or None if they go back."""
+    # (tactic_id, friendly name) pairs sorted by friendly name
+    sorted_display_tactics = _sorted_display_tactics(tactics)
+    tactic_index = _paged_select(
+        title,
+        _TACTIC_PICK_COLUMNS,
+        [(tactic_name,) for _tactic_id, tactic_name in sorted_display_tactics],
+        "tactic",
+    )
+    return None if tactic_index is None else sorted_display_tactics[tactic_index]
+
+
+def _pick_technique(platform: Optional[str], tactic_id: str, title: str) -> Optional[str]:
+    """Let the user pick a technique of a tactic, on one platform or on all (None). Returns None if they go back."""
+    # Sorted by technique ID (cached per platform and tactic)
+    sorted_tech_items = get_sorted_techniques(platform, tactic_id)
+    tech_index = _paged_select(
+        title,
+        _TECHNIQUE_PICK_COLUMNS,
+        [(tech_id, tech_info['name']) for tech_id, tech_info in sorted_tech_items],
+        "technique",
+    )
+    if tech_index is None:
+        return None  # Go back
+
+    technique_id = sorted_tech_items[tech_index][0]
+    console.print(f"[italic]Selected technique: {technique_id}[/italic]")
+    return technique_id
+
+
+def _select_technique_by_tactic() -> Optional[str]:
+    """Let the user pick a technique by browsing tactics. Returns None if they go back."""
+    all_tactics = get_all_tactics()
+    if not all_tactics:
+        console.print("[bold red]No tactics found in index data.[/bold red]")
+        pause()
+        return None
+
+    picked = _pick_tactic(all_tactics, "MITRE ATT&CK Tactics")
+    if picked is None:
+        return None  # Go back
+    selected_tactic_id, selected_tactic_name = picked
+
+    if not get_techniques(tactic=selected_tactic_id):
+        console.print(f"[yellow]No techniques found for tactic '{selected_tactic_name}'.[/yellow]")
+        pause()
+        return None
+
+    print_header(f"Techniques for '{selected_tactic_name}'")
+    return _pick_technique(None, selected_tactic_id, f"Available Techniques for {selected_tactic_name}")
+
+
+def _select_technique_by_platform() -> Optional[str]:
+    """Let the user pick a technique by browsing platforms and tactics. Returns None if they go back."""
+    platforms = _IDX.platforms
+    if not platforms:
+        console.print("[bold red]No platforms found in index data.[/bold red]")
+        pause()
+        return None
+
+    platform_index = _paged_select(
+        "Available Platforms",
+        _PLATFORM_PICK_COLUMNS,
+        [(platform_name.title(),) for platform_name in platforms],
+        "platform",
+    )
+    if platform_index is None:
+        return None  # Go back
+    selected_platform = platforms[platform_index]
+
+    tactics = get_tactics_for_platform(selected_platform)
+    if not tactics:
+        console.print(f"[yellow]No tactics found for platform '{selected_platform}'.[/yellow]")
+        pause()
+        return None
+
+    print_header(f"Tactics for Platform: {selected_platform.title()}")
+    picked = _pick_tactic(tactics, f"Tactics on {selected_platform.title()}")
+    if picked is None:
+        return None  # Go back
+    selected_tactic_id, selected_tactic_name = picked
+
+    if not get_techniques(platform=selected_platform, tactic=selected_tactic_id):
+        console.print(f"[yellow]No techniques found for tactic '{selected_tactic_name}' on platform '{selected_platform}'.[/yellow]")
+        pause()
+        return None
+
+    print_header(f"Techniques for '{selected_tactic_name}' on '{selected_platform.title()}'")
+    return _pick_technique(selected_platform, selected_tactic_id, "Available Techniques")
 
 
 def run_test_menu() -> None:
     """Display the run test menu and execute the selected test."""
+    from purple_cli.core.executor import run_atomic_test
+    c_print = console.print  # Bound once; called throughout the menu
+
     print_header("Run Atomic Red Team Test")
     
     # Show available techniques to select from
-    console.print("[bold]Select a technique to run:[/bold]")
-    console.print("1. Enter technique ID directly")
-    console.print("2. Browse available techniques")
-    console.print("3. Custom tests")
+    c_print(
+        "[bold]Select a technique to run:[/bold]\n"
+        "1. Enter technique ID directly\n"
+        "2. Browse available techniques\n"
+        "3. Custom tests"
+    )
     
-    choice = IntPrompt.ask("Enter your choice", default=1)
+    choice = fast_int_prompt("Enter your choice", default=1)
     
     technique_id = None
     if choice == 1:
         # Get technique ID directly
-        technique_id = Prompt.ask(
+        technique_id = fast_prompt(
             "Enter the MITRE ATT&CK Technique ID (e.g., T1003)",
             default="T1003"
         )
     elif choice == 2:
         # Browse available techniques
-        browse_choice = IntPrompt.ask(
+        browse_choice = fast_int_prompt(
             "\nBrowse by:\n1. Tactic\n2. Platform\nEnter your choice",
             default=1
         )
         
-        if browse_choice == 1:
-            # Browse by tactic to select technique
-            all_tactics = get_all_tactics()
-            if not all_tactics:
-                console.print("[bold red]No tactics found in index data.[/bold red]")
-                pause()
-                return
-            
-            table = Table(title="MITRE ATT&CK Tactics")
-            table.add_column("#", style="cyan", width=3)
-            table.add_column("Tactic Name", style="green")
-            
-            # Map normalized tactic IDs back to friendly names if possible
-            tactic_display_map = {t_id: TACTICS.get(t_id, t_id.replace('-', ' ').title()) for t_id in all_tactics}
-            sorted_display_tactics = sorted(tactic_display_map.items(), key=lambda item: item[1])
-            
-            for i, (_tactic_id, tactic_name) in enumerate(sorted_display_tactics, 1):
-                table.add_row(str(i), tactic_name)
-            
-            console.print(table)
-            console.print("\n")
-            
-            tactic_choice = IntPrompt.ask(
-                "Select a tactic number (0 to go back)",
-                default=0
-            )
-            
-            if 0 < tactic_choice <= len(sorted_display_tactics):
-                selected_tactic_id, selected_tactic_name = sorted_display_tactics[tactic_choice - 1]
-                
-                # Get all techniques for this tactic
-                techniques = get_techniques(tactic=selected_tactic_id)
-                
-                if not techniques:
-                    console.print(f"[yellow]No techniques found for tactic '{selected_tactic_name}'.[/yellow]")
-                    pause()
-                    return
-                
-                print_header(f"Techniques for '{selected_tactic_name}'")
-                technique_table = Table(title=f"Available Techniques for {selected_tactic_name}")
-                technique_table.add_column("#", style="cyan", width=3)
-                technique_table.add_column("Technique ID", style="cyan")
-                technique_table.add_column("Name")
-                
-                # Sort techniques by ID and display
-                sorted_tech_items = sorted(techniques.items())
-                for i, (tech_id, tech_info) in enumerate(sorted_tech_items, 1):
-                    technique_table.add_row(str(i), tech_id, tech_info.get('name', 'Unknown'))
-                
-                console.print(technique_table)
-                
-                tech_choice = IntPrompt.ask(
-                    "\nSelect a technique number (0 to go back)",
-                    default=0
-                )
-                
-                if 0 < tech_choice <= len(sorted_tech_items):
-                    technique_id = sorted_tech_items[tech_choice - 1][0]
-                    console.print(f"[italic]Selected technique: {technique_id}[/italic]")
-                else:
-                    return  # Go back
-            else:
-                return  # Go back
-            
-        elif browse_choice == 2:
-            # Browse by platform
-            if not AVAILABLE_PLATFORMS:
-                console.print("[bold red]No platforms found in index data.[/bold red]")
-                pause()
-                return
-                
-            table = Table(title="Available Platforms")
-            table.add_column("#", style="cyan", width=3)
-            table.add_column("Platform Name", style="green")
-            
-            for i, platform_name in enumerate(AVAILABLE_PLATFORMS, 1):
-                table.add_row(str(i), platform_name.title())
-            
-            console.print(table)
-            console.print("\n")
-            
-            platform_choice = IntPrompt.ask(
-                "Select a platform number (0 to go back)",
-                default=0
-            )
-            
-            if 0 < platform_choice <= len(AVAILABLE_PLATFORMS):
-                selected_platform = AVAILABLE_PLATFORMS[platform_choice - 1]
-                
-                # Get tactics for this platform
-                tactics = get_tactics_for_platform(selected_platform)
-                
-                if not tactics:
-                    console.print(f"[yellow]No tactics found for platform '{selected_platform}'.[/yellow]")
-                    pause()
-                    return
-                
-                print_header(f"Tactics for Platform: {selected_platform.title()}")
-                tactic_table = Table(title=f"Tactics on {selected_platform.title()}")
-                tactic_table.add_column("#", style="cyan", width=3)
-                tactic_table.add_column("Tactic Name", style="green")
-                
-                # Map normalized tactic IDs back to friendly names
-                tactic_display_map = {t_id: TACTICS.get(t_id, t_id.replace('-', ' ').title()) for t_id in tactics}
-                sorted_display_tactics = sorted(tactic_display_map.items(), key=lambda item: item[1])
-                
-                for i, (_tactic_id, tactic_name) in enumerate(sorted_display_tactics, 1):
-                    tactic_table.add_row(str(i), tactic_name)
-                
-                console.print(tactic_table)
-                console.print("\n")
-                
-                tactic_choice = IntPrompt.ask(
-                    "Select a tactic number (0 to go back)",
-                    default=0
-                )
-                
-                if 0 < tactic_choice <= len(sorted_display_tactics):
-                    selected_tactic_id, selected_tactic_name = sorted_display_tactics[tactic_choice - 1]
-                    
-                    # Get techniques for this platform and tactic
-                    techniques = get_techniques(platform=selected_platform, tactic=selected_tactic_id)
-                    
-                    if not techniques:
-                        console.print(f"[yellow]No techniques found for tactic '{selected_tactic_name}' on platform '{selected_platform}'.[/yellow]")
-                        pause()
-                        return
-                    
-                    print_header(f"Techniques for '{selected_tactic_name}' on '{selected_platform.title()}'")
-                    technique_table = Table(title=f"Available Techniques")
-                    technique_table.add_column("#", style="cyan", width=3)
-                    technique_table.add_column("Technique ID", style="cyan")
-                    technique_table.add_column("Name")
-                    
-                    # Sort techniques by ID and display
-                    sorted_tech_items = sorted(techniques.items())
-                    for i, (tech_id, tech_info) in enumerate(sorted_tech_items, 1):
-                        technique_table.add_row(str(i), tech_id, tech_info.get('name', 'Unknown'))
-                    
-                    console.print(technique_table)
-                    
-                    tech_choice = IntPrompt.ask(
-                        "\nSelect a technique number (0 to go back)",
-                        default=0
-                    )
-                    
-                    if 0 < tech_choice <= len(sorted_tech_items):
-                        technique_id = sorted_tech_items[tech_choice - 1][0]
-                        console.print(f"[italic]Selected technique: {technique_id}[/italic]")
-                    else:
-                        return  # Go back
-                else:
-                    return  # Go back
-            else:
-                return  # Go back
-        else:
-            console.print("[bold red]Invalid choice.[/bold red]")
-            pause()
-            return
+        technique_id = _BROWSE_TECHNIQUES_DISPATCH.get(browse_choice, _invalid_choice)()
+        if technique_id is None:
+            return  # Went back or invalid choice
     elif choice == 3:
         # Custom tests menu
         custom_test_menu()
         return
     else:
-        console.print("[bold red]Invalid choice.[/bold red]")
-        pause()
+        _invalid_choice()
         return
     
     # If we get here, we should have a technique_id
     if not technique_id:
-        console.print("[bold red]No technique selected.[/bold red]")
+        c_print("[bold red]No technique selected.[/bold red]")
         pause()
         return
         
     # Get test numbers (optional)
-    test_numbers_str = Prompt.ask(
+    test_numbers_str = fast_prompt(
         "Enter specific test numbers to run (comma-separated) or leave empty for all tests",
         default=""
     )
-    test_numbers = [int(n.strip()) for n in test_numbers_str.split(",")] if test_numbers_str.strip() else None
-    
-    # Options for test execution
-    options = [
-        "Execute Test",
-        "Check Prerequisites Only",
-        "Install Prerequisites",
-        "Cleanup After Test"
-    ]
+    if not _TEST_NUMBERS_RE.fullmatch(test_numbers_str):
+        c_print(f"[bold red]Error:[/bold red] Invalid test numbers '{markup.escape(test_numbers_str)}'. Use comma-separated integers, e.g. 1,2,3.")
+        pause()
+        return
+    test_numbers = list(map(int, _DIGITS_RE.findall(test_numbers_str))) or None
     
-    console.print("\n[bold]Select operation:[/bold]")
-    for i, option in enumerate(options, 1):
-        console.print(f"[bold cyan]{i}.[/bold cyan] {option}")
+    # Options for test execution
+    c_print("\n[bold]Select operation:[/bold]\n" + _TEST_OPERATION_TEXT)
     
-    operation = IntPrompt.ask("Enter your choice", default=1)
+    operation = fast_int_prompt("Enter your choice", default=1)
+    while not 1 <= operation <= len(_TEST_OPERATION_OPTIONS):
+        console.print("[red]Please select one of the available options[/red]")
+        operation = fast_int_prompt("Enter your choice", default=1)
     
     # Determine operation parameters
     check_prereqs = operation == 2
@@ -883,28 +1790,28 @@ def run_test_menu() -> None:
     cleanup = operation == 4
     
     # Ask about interactive mode
-    interactive_mode = Confirm.ask(
+    interactive_mode = fast_confirm(
         "\nAllow interactive GUI applications to display?",
         default=True
     )
     
     # Confirm execution
     technique_str = f"{technique_id}" + (f" (Tests: {test_numbers_str})" if test_numbers_str else "")
-    operation_str = options[operation-1]
+    operation_str = _TEST_OPERATION_OPTIONS[operation-1]
     
-    console.print(f"\n[bold]About to perform:[/bold] {operation_str} for {technique_str}")
+    c_print(f"\n[bold]About to perform:[/bold] {operation_str} for {technique_str}")
     if interactive_mode:
-        console.print("[bold]Interactive mode:[/bold] Enabled (GUI applications will display)")
+        c_print("[bold]Interactive mode:[/bold] Enabled (GUI applications will display)")
     else:
-        console.print("[bold]Interactive mode:[/bold] Disabled (output will be captured)")
+        c_print("[bold]Interactive mode:[/bold] Disabled (output will be captured)")
     
-    if not Confirm.ask("Continue?", default=True):
-        console.print("[yellow]Operation cancelled.[/yellow]")
+    if not fast_confirm("Continue?", default=True):
+        c_print("[yellow]Operation cancelled.[/yellow]")
         pause()
         return
     
     # Execute the test
-    console.print(f"\n[bold yellow]Executing {operation_str}...[/bold yellow]")
+    c_print(f"\n[bold yellow]Executing {operation_str}...[/bold yellow]")
     
     success, output = run_atomic_test(
         technique_id=technique_id,
@@ -917,11 +1824,11 @@ def run_test_menu() -> None:
     )
     
     if success:
-        console.print("\n[bold green]Operation completed successfully[/bold green]")
+        c_print("\n[bold green]Operation completed successfully[/bold green]")
         if not interactive_mode:  # Only print output if we captured it
-            console.print(output)
+            c_print(output)
     else:
-        console.print(f"\n[bold red]Operation failed:[/bold red] {output}")
+        c_print(f"\n[bold red]Operation failed:[/bold red] {output}")
     
     pause()
 
@@ -1031,6 +1938,8 @@ def install_nmap() -> bool:
 
 def get_local_ip() -> str:
     """Get the local IP address on the network."""
+    import socket
+
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -1279,40 +2188,34 @@ def perform_bruteforce(target_ip: str, port: str, service_module: str, user_list
         "--connection-limit", "5"
     ]
 
-    full_command_str = ' '.join(ncrack_command)
-    print(f"Executing Ncrack command: {full_command_str}")
-    
     try:
-        process = subprocess.Popen(ncrack_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+        # stderr is merged into stdout: with -vv ncrack writes a lot to both, and an
+        # unread stderr pipe would fill up and stall it while we read stdout
+        process = subprocess.Popen(ncrack_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
 
         found_credentials = False
-        live_output = []
+        live_output: Deque[str] = deque(maxlen=BRUTEFORCE_OUTPUT_TAIL_LINES)
         
-        while True:
-            output_line = process.stdout.readline()
-            if output_line == '' and process.poll() is not None:
-                break
+        for output_line in process.stdout:
+            output_line = output_line.strip()
             if output_line:
-                live_output.append(output_line.strip())
-                print(output_line.strip())
+                live_output.append(output_line)
+                console.print(output_line, markup=False, highlight=False)
                 if "Discovered credentials" in output_line:
                     found_credentials = True
-
-        stdout, stderr = process.communicate()
-        live_output.extend([line.strip() for line in stdout.splitlines() if line.strip()])
-        live_output.extend([line.strip() for line in stderr.splitlines() if line.strip()])
+        process.wait()
 
         final_output_str = "\n".join(live_output)
         
         if process.returncode != 0:
-            error_message = f"Ncrack exited with error code: {process.returncode}\nStderr: {stderr}"
-            print(f"Ncrack error: {error_message}")
+            error_message = f"Ncrack exited with error code: {process.returncode}"
+            console.print(f"[bold red]Ncrack error:[/bold red] {error_message}")
             return False, final_output_str + "\n" + error_message
 
         if found_credentials:
-            print("[bold green]Credentials found during brute-force![/bold green]")
+            console.print("[bold green]Credentials found during brute-force![/bold green]")
         else:
-            print("[bold yellow]No credentials found.[/bold yellow]")
+            console.print("[bold yellow]No credentials found.[/bold yellow]")
         
         return True, final_output_str
 
@@ -1320,7 +2223,7 @@ def perform_bruteforce(target_ip: str, port: str, service_module: str, user_list
         return False, f"Error: Ncrack executable not found at '{ncrack_path}'. Please ensure it's installed and accessible."
     except Exception as e:
         error_message = f"An unexpected error occurred during Ncrack brute-force: {e}"
-        print(f"[bold red]Critical error during Ncrack execution:[/bold red] {error_message}")
+        console.print(f"[bold red]Critical error during Ncrack execution:[/bold red] {markup.escape(error_message)}")
         if 'process' in locals() and process.poll() is None:
             process.terminate()
             process.wait()
@@ -1329,6 +2232,8 @@ def perform_bruteforce(target_ip: str, port: str, service_module: str, user_list
 
 def run_escalation_flow(check_prereqs=False, get_prereqs=False, cleanup_flag=False, capture_output=True) -> tuple[bool, str]:
     """Checks for Nmap and runs it to scan for open ports, then offers brute-force."""
+    from rich.table import Table
+
     global simulation_actions
 
     # --- Initial check for flags ---
@@ -1412,7 +2317,7 @@ def run_escalation_flow(check_prereqs=False, get_prereqs=False, cleanup_flag=Fal
             console.print("[bold cyan]2.[/bold cyan] Perform Cleanup")
             console.print("[bold cyan]0.[/bold cyan] Go back to main menu")
 
-            action_choice = IntPrompt.ask("Enter your choice", choices=["0", "1", "2"], default=0)
+            action_choice = IntPrompt.ask("Enter your choice", choices=_PORT_ACTION_CHOICES, default=0)
 
             if action_choice == 1:
                 table = Table(title="Available Open Ports")
@@ -1541,7 +2446,7 @@ def run_escalation_flow(check_prereqs=False, get_prereqs=False, cleanup_flag=Fal
         console.print("[bold cyan]1.[/bold cyan] Perform Cleanup")
         console.print("[bold cyan]0.[/bold cyan] Go back to main menu")
 
-        action_choice = IntPrompt.ask("Enter your choice", choices=["0", "1"], default=0)
+        action_choice = IntPrompt.ask("Enter your choice", choices=_NO_PORT_ACTION_CHOICES, default=0)
         if action_choice == 1:
             cleanup()
             pause()
@@ -1558,27 +2463,10 @@ def list_playbooks_menu() -> None:
     """Display the list of available playbooks."""
     print_header("Available Playbooks")
     
-    playbooks = get_available_playbooks()
-    
-    # Create a table to display the results
-    table = Table(title="Available Playbooks")
-    table.add_column("#", style="cyan", width=3)
-    table.add_column("Name", style="cyan")
-    table.add_column("Description")
+    playbooks = _playbooks()
     
-    # Add rows to the table - ensure playbooks is a list and each item is a dictionary
-    if playbooks and isinstance(playbooks, list):
-        for i, playbook in enumerate(playbooks, 1):
-            if isinstance(playbook, dict):
-                name = playbook.get("name", "Unknown")
-                description = playbook.get("description", "")
-                table.add_row(str(i), name, description)
-            else:
-                # Handle non-dictionary items safely
-                table.add_row(str(i), str(playbook) if playbook else "Unknown", "")
-    
-    # Display the table
-    console.print(table)
+    # Display the table (built once per playbook list)
+    console.print(_playbook_table(playbooks))
     
     # Option to view playbook details
     console.print("\n")
@@ -1600,18 +2488,8 @@ def list_playbooks_menu() -> None:
         try:
             index = int(user_input)
             if playbooks and 1 <= index <= len(playbooks):
-                # Make sure we safely access the playbook name
-                if isinstance(playbooks[index-1], dict):
-                    playbook_name = playbooks[index-1].get("name")
-                    if playbook_name:
-                        console.print(f"[italic]Selected playbook: {playbook_name}[/italic]")
-                    else:
-                        console.print("[bold red]Error:[/bold red] Could not get playbook name.")
-                        pause()
-                        return
-                else:
-                    playbook_name = str(playbooks[index-1])
-                    console.print(f"[italic]Selected playbook: {playbook_name}[/italic]")
+                playbook_name = playbooks[index-1]["name"]
+                console.print(f"[italic]Selected playbook: {playbook_name}[/italic]")
             else:
                 console.print(f"[bold red]Invalid number. Please enter a number between 1 and {len(playbooks)}.[/bold red]")
                 pause()
@@ -1625,20 +2503,26 @@ def list_playbooks_menu() -> None:
             return
         
         if playbook_name:
-            playbook = get_playbook(playbook_name)
+            playbook = _get_playbook(playbook_name)
             if playbook:
+                from rich.console import Group
+
                 print_header(f"Playbook: {playbook.name}")
                 
-                console.print(f"[bold]Description:[/bold] {playbook.description}")
-                console.print("\n[bold]Tests:[/bold]")
-                
+                test_lines = []
                 for i, test in enumerate(playbook.tests, 1):
                     test_nums = f" (Tests: {', '.join(map(str, test.test_numbers))})" if test.test_numbers else ""
-                    console.print(f"{i}. {test.technique_id}{test_nums} - {test.description}")
+                    test_lines.append(f"{i}. {test.technique_id}{test_nums} - {test.description}")
                 
+                # Render the whole details view in a single print
+                sections = [
+                    f"[bold]Description:[/bold] {playbook.description}",
+                    "\n[bold]Tests:[/bold]",
+                    "\n".join(test_lines),
+                ]
                 if playbook.blue_team_guidance:
-                    console.print("\n[bold]Blue Team Guidance:[/bold]")
-                    console.print(playbook.blue_team_guidance)
+                    sections += ["\n[bold]Blue Team Guidance:[/bold]", playbook.blue_team_guidance]
+                console.print(Group(*sections))
             else:
                 console.print(f"[bold red]Playbook '{playbook_name}' not found.[/bold red]")
             
@@ -1649,398 +2533,419 @@ def list_playbooks_menu() -> None:
 
 def run_playbook_menu() -> None:
     """Display the run playbook menu and execute the selected playbook."""
-    print_header("Run Playbook")
-    
-    # List available playbooks
-    playbooks = get_available_playbooks()
-    if not playbooks:
-        console.print("[yellow]No playbooks found.[/yellow]")
-        pause()
-        return
+    from purple_cli.core.playbook import execute_playbook
+    c_print = console.print  # Bound once; called throughout the menu
+
+    # Loop rather than recurse when going back to the playbook selection
+    while True:
+        print_header("Run Playbook")
     
-    # Create a table to display the results
-    table = Table(title="Available Playbooks")
-    table.add_column("#", style="cyan", width=3)
-    table.add_column("Name", style="cyan")
-    table.add_column("Description")
+        # List available playbooks
+        playbooks = _playbooks()
+        if not playbooks:
+            c_print("[yellow]No playbooks found.[/yellow]")
+            pause()
+            return
     
-    # Add rows to the table
-    for i, playbook in enumerate(playbooks, 1):
-        table.add_row(
-            str(i),
-            playbook["name"],
-            playbook["description"]
-        )
+        # Display the table (shared with the playbook list menu)
+        c_print(_playbook_table(playbooks))
     
-    # Display the table
-    console.print(table)
+        # Get playbook selection
+        user_input = fast_prompt(
+            "\nEnter the number or name of the playbook to run (or press Enter to go back)",
+            default=""
+        ).strip()
     
-    # Get playbook selection
-    user_input = Prompt.ask(
-        "\nEnter the number or name of the playbook to run (or press Enter to go back)",
-        default=""
-    ).strip()
+        if not user_input:
+            return  # Go back to main menu
     
-    if not user_input:
-        return  # Go back to main menu
+        playbook_name = None
+        # Check if input is a number and within valid range
+        try:
+            index = int(user_input)
+            if 1 <= index <= len(playbooks):
+                playbook_name = playbooks[index-1]["name"]
+                c_print(f"[italic]Selected playbook: {playbook_name}[/italic]")
+            else:
+                c_print(f"[bold red]Invalid number. Please enter a number between 1 and {len(playbooks)}.[/bold red]")
+                pause()
+                continue  # Restart menu
+        except ValueError:
+            # Not a number, treat as playbook name (case-insensitive, like get_playbook).
+            # Resolve it now so a typo is caught before the operation prompts
+            name_index = {playbook["name"].lower(): playbook["name"] for playbook in playbooks}
+            playbook_name = name_index.get(user_input.lower())
+            if playbook_name is None:
+                c_print(f"[bold red]Playbook '{markup.escape(user_input)}' not found.[/bold red]")
+                pause()
+                continue  # Restart menu
     
-    playbook_name = None
-    # Check if input is a number and within valid range
-    try:
-        index = int(user_input)
-        if 1 <= index <= len(playbooks):
-            playbook_name = playbooks[index-1]["name"]
-            console.print(f"[italic]Selected playbook: {playbook_name}[/italic]")
-        else:
-            console.print(f"[bold red]Invalid number. Please enter a number between 1 and {len(playbooks)}.[/bold red]")
-            pause()
-            run_playbook_menu()  # Restart menu
-            return
-    except ValueError:
-        # Not a number, treat as playbook name
-        playbook_name = user_input
-    
-    if not playbook_name:
-        return  # Should not happen, but just in case
-    
-    # Options for playbook execution
-    options = [
-        "Execute Playbook",
-        "Check Prerequisites Only",
-        "Install Prerequisites",
-        "Cleanup After Tests"
-    ]
+        if not playbook_name:
+            return  # Should not happen, but just in case
     
-    console.print("\n[bold]Select operation:[/bold]")
-    for i, option in enumerate(options, 1):
-        console.print(f"[bold cyan]{i}.[/bold cyan] {option}")
+        # Options for playbook execution
+        c_print("\n[bold]Select operation:[/bold]\n" + _PLAYBOOK_OPERATION_TEXT)
     
-    operation = IntPrompt.ask("Enter your choice", default=1)
+        operation = fast_int_prompt("Enter your choice", default=1)
+        while not 1 <= operation <= len(_PLAYBOOK_OPERATION_OPTIONS):
+            console.print("[red]Please select one of the available options[/red]")
+            operation = fast_int_prompt("Enter your choice", default=1)
     
-    # Determine operation parameters
-    check_prereqs = operation == 2
-    get_prereqs = operation == 3
-    cleanup = operation == 4
+        # Determine operation parameters
+        check_prereqs = operation == 2
+        get_prereqs = operation == 3
+        cleanup = operation == 4
     
-    # Confirm execution
-    operation_str = options[operation-1]
-    console.print(f"\n[bold]About to perform:[/bold] {operation_str} for playbook '{playbook_name}'")
+        # Confirm execution
+        operation_str = _PLAYBOOK_OPERATION_OPTIONS[operation-1]
+        c_print(f"\n[bold]About to perform:[/bold] {operation_str} for playbook '{playbook_name}'")
     
-    if not Confirm.ask("Continue?", default=True):
-        console.print("[yellow]Operation cancelled.[/yellow]")
-        pause()
-        run_playbook_menu()  # Go back to playbook selection
-        return
+        if not fast_confirm("Continue?", default=True):
+            c_print("[yellow]Operation cancelled.[/yellow]")
+            pause()
+            continue  # Go back to playbook selection
     
-    # Execute the playbook
-    console.print(f"\n[bold yellow]Executing {operation_str}...[/bold yellow]")
+        # Execute the playbook
+        c_print(f"\n[bold yellow]Executing {operation_str}...[/bold yellow]")
     
-    success, results = execute_playbook(
-        playbook_name=playbook_name,
-        check_prereqs=check_prereqs,
-        get_prereqs=get_prereqs,
-        cleanup=cleanup
-    )
+        success, results = execute_playbook(
+            playbook_name=playbook_name,
+            check_prereqs=check_prereqs,
+            get_prereqs=get_prereqs,
+            cleanup=cleanup
+        )
     
-    if success:
-        console.print("\n[bold green]Playbook execution completed successfully[/bold green]")
-    else:
-        console.print("\n[bold red]Playbook execution had some failures[/bold red]")
-    
-    # Display test results summary
-    if results:
-        console.print("\n[bold]Test Summary:[/bold]")
-        for i, result in enumerate(results, 1):
-            status = "[green]✓ Success[/green]" if result.get("success", False) else "[red]✗ Failed[/red]"
-            tech_id = result.get('technique_id', 'Unknown')
-            test_num = result.get('test_number', '')
-            test_id_str = f"{tech_id}{f' #{test_num}' if test_num else ''}"
-            console.print(f"{i}. {test_id_str:<15} - {status}")
-    else:
-        console.print("[yellow]No detailed results available for this operation.[/yellow]")
+        if success:
+            c_print("\n[bold green]Playbook execution completed successfully[/bold green]")
+        else:
+            c_print("\n[bold red]Playbook execution had some failures[/bold red]")
+    
+        # Display test results summary, rendered once as a single table
+        if results:
+            from rich.table import Table
+
+            summary_table = Table(title="Test Summary", title_justify="left")
+            summary_table.add_column("#", style="cyan", width=3)
+            summary_table.add_column("Test", no_wrap=True)
+            summary_table.add_column("Status")
+            summary_table.add_column("Description")
+            add_row = summary_table.add_row
+            for i, result in enumerate(results, 1):
+                test_id_str = result.get('technique_id', 'Unknown')
+                test_num = result.get('test_number')
+                if test_num:
+                    test_id_str = f"{test_id_str} #{test_num}"
+                add_row(
+                    str(i),
+                    test_id_str,
+                    _SUMMARY_SUCCESS if result.get("success") else _SUMMARY_FAILED,
+                    result.get('description') or result.get('error', ''),
+                )
+            c_print("", summary_table)
+        else:
+            c_print("[yellow]No detailed results available for this operation.[/yellow]")
     
-    pause()
+        pause()
+        return
+
+
+@lru_cache(maxsize=16)
+def _config_summary(
+    atomics_path: Optional[str],
+    powershell_path: Optional[str],
+    timeout: int,
+    phishing_site_path: Optional[str],
+    phishing_module_path: Optional[str],
+) -> str:
+    """Build the 'Current Configuration' block of the configuration menu (memoized on the values shown)."""
+    atomics_display = markup.escape(atomics_path) if atomics_path else "[italic yellow]Not set[/italic]"
+    powershell_display = markup.escape(powershell_path) if powershell_path else "[italic yellow]Not set (using default)[/italic]"
+    # Timeout is an int, no need to escape
+    phishing_site_display = markup.escape(phishing_site_path) if phishing_site_path else "[italic yellow]Not set[/italic]"
+    phishing_module_display = markup.escape(phishing_module_path) if phishing_module_path else "[italic yellow]Not set[/italic]"
+    return (
+        "[bold]Current Configuration:[/bold]\n"
+        f"1. Atomics Path:    {atomics_display}\n"
+        f"2. PowerShell Path: {powershell_display}\n"
+        f"3. Command Timeout: {timeout} seconds\n"
+        f"4. Phishing Site Path:  {phishing_site_display}\n"
+        f"5. Phishing Module Path: {phishing_module_display}"
+    )
 
 
 def configuration_menu() -> None:
     """Display the configuration menu."""
-    # Declare globals at the top of the function scope
-    global INDEX_DATA_CACHE, AVAILABLE_PLATFORMS
-
     while True:
         print_header("Configuration")
         
         config = get_config()
         
         # Display current configuration
-        atomics_display = markup.escape(config.atomics_path) if config.atomics_path else "[italic yellow]Not set[/italic]"
-        powershell_display = markup.escape(config.powershell_path) if config.powershell_path else "[italic yellow]Not set (using default)[/italic]"
-        # Timeout is an int, no need to escape
-        phishing_site_display = markup.escape(config.phishing_site_path) if config.phishing_site_path else "[italic yellow]Not set[/italic]"
-        phishing_module_display = markup.escape(config.phishing_module_path) if config.phishing_module_path else "[italic yellow]Not set[/italic]"
-
-        console.print("[bold]Current Configuration:[/bold]")
-        console.print(f"1. Atomics Path:    {atomics_display}")
-        console.print(f"2. PowerShell Path: {powershell_display}")
-        console.print(f"3. Command Timeout: {config.timeout} seconds")
-        console.print(f"4. Phishing Site Path:  {phishing_site_display}")
-        console.print(f"5. Phishing Module Path: {phishing_module_display}")
-
-        # Determine the base for option numbering
-        # Number of displayed config items + 1 for the first actual option
-        # Current config items: Atomics Path, PowerShell Path, Timeout, Phishing Site Path, Phishing Module Path (5 items)
-        # So, options start at 5 + 1 = 6
-        options_start_num = 6
+        console.print(_config_summary(
+            config.atomics_path, config.powershell_path, config.timeout,
+            config.phishing_site_path, config.phishing_module_path,
+        ))
 
-        
-        # Configuration options
-        options = [
-            "Set Atomics Path",
-            "Set PowerShell Path",
-            "Set Command Timeout",
-            "Set Phishing Site Path",
-            "Set Phishing Module Path", # New
-            "Return to Main Menu"
-        ]
-        
         console.print("\n[bold]Options:[/bold]")
-        for i, option in enumerate(options, 1):
-            console.print(f"[bold cyan]{options_start_num + i -1}.[/bold cyan] {option}")
+        console.print(_CONFIG_MENU_TEXT)
         
-        choice = IntPrompt.ask("\nEnter number to modify or return", default=options_start_num + len(options) - 1) # Default to return
+        choice = fast_int_prompt("\nEnter number to modify or return", default=_CONFIG_RETURN_CHOICE) # Default to return
         
-        if choice == 1: # Corresponds to Atomics Path display line
-            # Corrected indentation
-            path = Prompt.ask(
-                 "Enter the path to the atomic-red-team/atomics directory",
-                 default=config.atomics_path or ""
-            ).strip()
-            # Basic validation: check if path exists and is a directory
-            # Corrected indentation
-            if path and Path(path).is_dir():
-                # Corrected indentation
-                set_config("atomics_path", path)
-                # Corrected indentation
-                console.print(f"[bold green]Atomics path set to:[/bold green] {path}")
-                # Clear cache as index path might change
-                # Corrected indentation
-                # global INDEX_DATA_CACHE, AVAILABLE_PLATFORMS # Removed from here
-                # Corrected indentation
-                INDEX_DATA_CACHE = {}
-                # Corrected indentation
-                AVAILABLE_PLATFORMS = []
-            # Corrected indentation
-            elif path:
-                # Corrected indentation
-                console.print(f"[bold red]Error:[/bold red] Path '{path}' does not exist or is not a directory.")
-            # Corrected indentation
-            else:
-                # Corrected indentation
-                console.print("[yellow]Atomics path not changed.[/yellow]")
-            # Corrected indentation
-            pause()
+        if choice == _CONFIG_RETURN_CHOICE: # Return to Main Menu option
+            break
+        handler = _CONFIG_DISPATCH.get(choice)
+        if handler is None:
+            console.print("[red]Invalid choice.[/red]")
+        else:
+            handler(config)
+        pause()
 
-        elif choice == 2: # Corresponds to PowerShell Path display line
-            path = Prompt.ask(
-                "Enter the path to the PowerShell executable (e.g., 'powershell' or '/usr/bin/pwsh')",
-                default=config.powershell_path or "powershell"
-            ).strip()
-            # No easy validation here, just set it
-            if path:
-                set_config("powershell_path", path)
-                console.print(f"[bold green]PowerShell path set to:[/bold green] {path}")
-            else:
-                # Corrected indentation
-                console.print("[yellow]PowerShell path not changed.[/yellow]")
-            pause()
-        
-        elif choice == 3: # Corresponds to Timeout display line
-            timeout = IntPrompt.ask(
-                "Enter the command timeout in seconds (e.g., 300)",
-                default=config.timeout,
-                show_default=True
-            )
-            if timeout > 0:
-                set_config("timeout", timeout)
-                console.print(f"[bold green]Command timeout set to:[/bold green] {timeout} seconds")
-            else:
-                # Corrected indentation
-                console.print("[yellow]Timeout must be a positive number. Not changed.[/yellow]")
-            pause()
-        
-        elif choice == options_start_num: # 6. Set Atomics Path option
-            # Corrected indentation
-            path = Prompt.ask(
-                 "Enter the path to the atomic-red-team/atomics directory",
-                 default=config.atomics_path or ""
-            ).strip()
-            # Corrected indentation
-            if path and Path(path).is_dir():
-                # Corrected indentation
-                set_config("atomics_path", path)
-                # Corrected indentation
-                console.print(f"[bold green]Atomics path set to:[/bold green] {path}")
-                # Corrected indentation - Need global here too
-                # global INDEX_DATA_CACHE, AVAILABLE_PLATFORMS # Removed from here
-                INDEX_DATA_CACHE = {} # Clear cache
-                # Corrected indentation
-                AVAILABLE_PLATFORMS = []
-            # Corrected indentation
-            elif path:
-                # Corrected indentation
-                console.print(f"[bold red]Error:[/bold red] Path '{path}' does not exist or is not a directory.")
-            # Corrected indentation
-            else:
-                # Corrected indentation
-                console.print("[yellow]Atomics path not changed.[/yellow]")
-            # Corrected indentation
-            pause()
 
-        elif choice == options_start_num + 1: # 7. Set PowerShell Path option
-            path = Prompt.ask(
-                "Enter the path to the PowerShell executable (e.g., 'powershell' or '/usr/bin/pwsh')",
-                default=config.powershell_path or "powershell"
-            ).strip()
-            if path:
-                set_config("powershell_path", path)
-                console.print(f"[bold green]PowerShell path set to:[/bold green] {path}")
-            else:
-                # Corrected indentation
-                console.print("[yellow]PowerShell path not changed.[/yellow]")
-            pause()
+def _is_valid_dir(path: str) -> bool:
+    """
+    Whether path is an existing directory.
 
-        elif choice == options_start_num + 2: # 8. Set Command Timeout option
-            timeout = IntPrompt.ask(
-                "Enter the command timeout in seconds (e.g., 300)",
-                default=config.timeout,
-                show_default=True
-            )
-            if timeout > 0:
-                set_config("timeout", timeout)
-                console.print(f"[bold green]Command timeout set to:[/bold green] {timeout} seconds")
-            else:
-                # Corrected indentation
-                console.print("[yellow]Timeout must be a positive number. Not changed.[/yellow]")
-            pause()
+    Only positive results are remembered, so a directory created after a
+    failed attempt is picked up on the next try.
+    """
+    if path in _VALID_DIRS:
+        return True
+    if Path(path).is_dir():
+        _VALID_DIRS.add(path)
+        return True
+    return False
+
+
+def _set_atomics_path(config: AppConfig) -> None:
+    """Prompt for and save the atomics directory, clearing data loaded from the old one."""
+    path = fast_prompt(
+         "Enter the path to the atomic-red-team/atomics directory",
+         default=config.atomics_path or ""
+    ).strip()
+    # Basic validation: check if path exists and is a directory
+    if path and _is_valid_dir(path):
+        set_config("atomics_path", path)
+        console.print(f"[bold green]Atomics path set to:[/bold green] {path}")
+        # Clear cache as index path might change
+        invalidate_atomics_caches()
+    elif path:
+        console.print(f"[bold red]Error:[/bold red] Path '{path}' does not exist or is not a directory.")
+    else:
+        console.print("[yellow]Atomics path not changed.[/yellow]")
 
-        elif choice == options_start_num + 3: # 9. Set Phishing Site Path option
-            path_str = Prompt.ask(
-                "Enter the path to your 'phishing_site' directory",
-                default=config.phishing_site_path or ""
-            ).strip()
-            if path_str:
-                phishing_path = Path(path_str)
-                if phishing_path.is_dir() and (phishing_path / "api" / "index.js").exists():
-                    set_config("phishing_site_path", str(phishing_path.resolve()))
-                    console.print(f"[bold green]Phishing site path set to:[/bold green] {phishing_path.resolve()}")
-                else:
-                    console.print(f"[bold red]Error:[/bold red] Path '{phishing_path}' does not seem to be a valid phishing_site directory (missing api/index.js).")
-            pause()
-        elif choice == options_start_num + 4: # 10. Set Phishing Module Path option
-            path_str = Prompt.ask(
-                "Enter the path to your 'phishing-module' directory (containing send_email.py)",
-                default=config.phishing_module_path or ""
-            ).strip()
-            if path_str:
-                module_path = Path(path_str)
-                if module_path.is_dir() and (module_path / "send_email.py").exists():
-                    set_config("phishing_module_path", str(module_path.resolve()))
-                    console.print(f"[bold green]Phishing module path set to:[/bold green] {module_path.resolve()}")
-                else:
-                    console.print(f"[bold red]Error:[/bold red] Path '{module_path}' does not seem to be a valid phishing-module directory (missing send_email.py).")
-            pause()
 
-        elif choice == options_start_num + 5: # 11. Return to Main Menu option
-            break
+def _set_powershell_path(config: AppConfig) -> None:
+    """Prompt for and save the PowerShell executable."""
+    path = fast_prompt(
+        "Enter the path to the PowerShell executable (e.g., 'powershell' or '/usr/bin/pwsh')",
+        default=config.powershell_path or "powershell"
+    ).strip()
+    # No easy validation here, just set it
+    if path:
+        set_config("powershell_path", path)
+        console.print(f"[bold green]PowerShell path set to:[/bold green] {path}")
+    else:
+        console.print("[yellow]PowerShell path not changed.[/yellow]")
+
+
+def _set_timeout(config: AppConfig) -> None:
+    """Prompt for and save the command timeout."""
+    timeout = fast_int_prompt(
+        "Enter the command timeout in seconds (e.g., 300)",
+        default=config.timeout,
+        show_default=True
+    )
+    if timeout > 0:
+        set_config("timeout", timeout)
+        console.print(f"[bold green]Command timeout set to:[/bold green] {timeout} seconds")
+    else:
+        console.print("[yellow]Timeout must be a positive number. Not changed.[/yellow]")
+
+
+def _set_phishing_site_path(config: AppConfig) -> None:
+    """Prompt for and save the phishing_site directory."""
+    path_str = fast_prompt(
+        "Enter the path to your 'phishing_site' directory",
+        default=config.phishing_site_path or ""
+    ).strip()
+    if path_str:
+        phishing_path = Path(path_str)
+        if phishing_path.is_dir() and (phishing_path / "api" / "index.js").exists():
+            set_config("phishing_site_path", str(phishing_path.resolve()))
+            console.print(f"[bold green]Phishing site path set to:[/bold green] {phishing_path.resolve()}")
         else:
-            console.print("[red]Invalid choice.[/red]")
-            pause()
+            console.print(f"[bold red]Error:[/bold red] Path '{phishing_path}' does not seem to be a valid phishing_site directory (missing api/index.js).")
+
+
+def _set_phishing_module_path(config: AppConfig) -> None:
+    """Prompt for and save the phishing-module directory."""
+    path_str = fast_prompt(
+        "Enter the path to your 'phishing-module' directory (containing send_email.py)",
+        default=config.phishing_module_path or ""
+    ).strip()
+    if path_str:
+        module_path = Path(path_str)
+        if module_path.is_dir() and (module_path / "send_email.py").exists():
+            set_config("phishing_module_path", str(module_path.resolve()))
+            console.print(f"[bold green]Phishing module path set to:[/bold green] {module_path.resolve()}")
+        else:
+            console.print(f"[bold red]Error:[/bold red] Path '{module_path}' does not seem to be a valid phishing-module directory (missing send_email.py).")
+
+
+def _print_output_line(line: str) -> None:
+    """Default output handler for streamed commands: echo the line as plain text."""
+    console.print(line, end="", markup=False)
+
 
+async def _run_ps_command_async(
+    command: List[str],
+    timeout: float,
+    on_line: Callable[[str], None] = _print_output_line,
+    max_output_chars: Optional[int] = MAX_CAPTURED_OUTPUT_CHARS,
+) -> Tuple[Optional[int], Optional[str], str]:
+    """
+    Run a command, passing each line of its output to on_line as it arrives.
 
-# Removed build_list_tests_command as we now use executor.build_command directly
+    Args:
+        command: The command to execute as a list of strings.
+        timeout: Seconds to wait before killing the process.
+        on_line: Called with each output line (including its newline).
+        max_output_chars: Stop keeping output once it grows past this many
+            characters (it is still passed to on_line). None keeps everything.
 
+    Returns:
+        A tuple of (exit_code, output, tail). The exit code is None if the command timed
+        out; the output is None if it grew past max_output_chars. The tail is the last
+        ERROR_OUTPUT_TAIL_CHARS characters of output, kept either way for error messages.
+    """
+    import asyncio
+
+    # stderr is merged into stdout so a chatty stderr cannot fill its pipe
+    # and block the process while we are reading stdout
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=1024 * 1024, # Allow long lines (e.g. full test details)
+    )
+    encoding = locale.getpreferredencoding(False)
+    lines: Optional[List[str]] = []
+    kept_chars = 0
+    tail: Deque[str] = deque()
+    tail_chars = 0
+
+    async def _pump() -> int:
+        nonlocal lines, kept_chars, tail_chars
+        while True:
+            raw = await process.stdout.readline()
+            if not raw:
+                break
+            line = raw.decode(encoding, errors="replace").replace("\r\n", "\n")
+            on_line(line)
+            tail.append(line)
+            tail_chars += len(line)
+            while tail_chars - len(tail[0]) >= ERROR_OUTPUT_TAIL_CHARS:
+                tail_chars -= len(tail.popleft())
+            if lines is not None:
+                kept_chars += len(line)
+                if max_output_chars is not None and kept_chars > max_output_chars:
+                    lines = None # Too much to hold on to; it has been shown already
+                else:
+                    lines.append(line)
+        return await process.wait()
 
-def execute_ps_command(command: List[str]) -> tuple[bool, str]:
+    try:
+        returncode: Optional[int] = await asyncio.wait_for(_pump(), timeout)
+    except asyncio.TimeoutError:
+        returncode = None
+    finally:
+        if process.returncode is None: # Timed out or interrupted (e.g. Ctrl+C)
+            process.kill()
+            await process.wait()
+    return returncode, None if lines is None else "".join(lines), "".join(tail)[-ERROR_OUTPUT_TAIL_CHARS:]
+
+
+def execute_ps_command(
+    command: List[str],
+    on_line: Callable[[str], None] = _print_output_line,
+    max_output_chars: Optional[int] = MAX_CAPTURED_OUTPUT_CHARS,
+) -> Tuple[bool, Optional[str]]:
     """
-    Execute a PowerShell command and return the results.
+    Execute a PowerShell command, streaming its output to the console as it arrives.
+    
+    A spinner is shown while the command runs.
     
     Args:
         command: The PowerShell command to execute as a list of strings.
+        on_line: Called with each output line as it arrives. Prints it by default.
+        max_output_chars: Largest output to keep in memory and return (None for no limit).
         
     Returns:
-        A tuple containing (success_flag, output_or_error_text).
+        A tuple containing (success_flag, output_or_error). Output is printed while
+        the command runs and also returned on success, or None if it was larger
+        than max_output_chars. On failure, the error includes the end of the output.
     """
-    import subprocess
-    
+    import asyncio
+
     config = get_config()
     ps_path = config.powershell_path or "powershell" # Use default if not set
     
     # Ensure the command uses the configured path
-    if command[0] != ps_path:
+    if command[0] not in (ps_path, resolve_powershell_path(ps_path)):
         command = [ps_path] + command[1:]
 
     try:
-        result = subprocess.run(
-            command,
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=config.timeout,
-            shell=False # Important for security and correct argument handling
-        )
-        return True, result.stdout
+        with console.status("Running PowerShell command..."):
+            returncode, output, tail = asyncio.run(
+                _run_ps_command_async(command, config.timeout, on_line, max_output_chars)
+            )
     except FileNotFoundError:
-        # Corrected indentation
-        return False, f"Error: PowerShell executable not found at '{ps_path}'. Please check configuration."
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Command failed with exit code {e.returncode}.\n"
-        error_msg += f"Command: {' '.join(command)}\n" # Show command that failed
-        if e.stdout: # Include stdout for context
-            # Corrected indentation
-            error_msg += f"Stdout:\n{e.stdout}\n"
-        if e.stderr:
-            error_msg += f"Stderr:\n{e.stderr}"
-        return False, error_msg
-    except subprocess.TimeoutExpired:
-        return False, f"Command timed out after {config.timeout} seconds.\nCommand: {' '.join(command)}"
+        return False, f"Error: PowerShell executable not found at '{markup.escape(ps_path)}'. Please check configuration."
     except OSError as e: # Catch OSError for broader system-level errors like permissions
-        return False, f"An OS error occurred: {str(e)}\nCommand: {' '.join(command)}"
-    # Removed broad Exception catch
+        return False, f"An OS error occurred: {markup.escape(str(e))}\nCommand: {markup.escape(shlex.join(command))}"
+
+    if returncode == 0:
+        return True, output
+    if returncode is None:
+        error = f"Command timed out after {config.timeout} seconds.\nCommand: {markup.escape(shlex.join(command))}"
+    else:
+        error = f"Command failed with exit code {returncode}.\nCommand: {markup.escape(shlex.join(command))}"
+    # The end of the output usually holds the PowerShell error
+    if tail.strip():
+        error += f"\nOutput:\n{markup.escape(tail)}"
+    return False, error
 
 
 def run_interactive_cli() -> None:
     """Run the interactive CLI menu system."""
+    # Start PowerShell once in the background so the first test listing isn't a cold start.
+    # Skipped when it isn't installed, since there is nothing to warm up
+    if shutil.which(resolve_powershell_path(get_config().powershell_path)):
+        _bg_submit(warm_up_powershell)
+
     # Load index data once at the start
     ensure_index_data_loaded() # Changed to use ensure function
     
     while True:
         choice = show_main_menu()
         
-        if choice == "List Tests":
-            list_tests_menu()
-        elif choice == "Run Test":
-            run_test_menu()
-        elif choice == "List Playbooks":
-            list_playbooks_menu()
-        elif choice == "Run Playbook":
-            run_playbook_menu()
-        elif choice == "Help":
-            show_help()
-        elif choice == "Configuration":
-            configuration_menu()
-        elif choice == "Exit":
-            print_header("Exiting Purple Team CLI")
-            console.print("Thank you for using Purple Team CLI!")
-            sys.exit(0)
+        if choice:
+            _DISPATCH[choice-1]()
         else:
             console.print("[bold red]Invalid choice. Please try again.[/bold red]")
             pause()
 
 
-def show_help() -> None:
-    """Display the help screen."""
-    print_header("Help - Purple Team CLI")
-    console.print("""
+def _exit() -> None:
+    """Say goodbye and exit the CLI."""
+    print_header("Exiting Purple Team CLI")
+    console.print("Thank you for using Purple Team CLI!")
+    # Drop queued prefetches rather than waiting for them before exiting
+    _bg.shutdown(wait=False, cancel_futures=True)
+    sys.exit(0)
+
+
+_HELP_TEXT: Final = """
 Welcome to the Purple Team CLI! This tool allows you to interact with Atomic Red Team tests and playbooks.
 
 [bold cyan]Main Menu Options:[/bold cyan]
@@ -2055,39 +2960,53 @@ Welcome to the Purple Team CLI! This tool allows you to interact with Atomic Red
 For more information, please refer to the documentation or visit the Atomic Red Team repository.
 
 [italic]Press Enter to return to the main menu.[/italic]
-""")
+"""
+
+
+def show_help() -> None:
+    """Display the help screen."""
+    print_header("Help - Purple Team CLI")
+    console.print(_HELP_TEXT)
     pause()
 
 
 def custom_test_menu() -> None:
     """Display menu of available custom tests."""
-    print_header("Custom Tests")
-    
-    # Show available custom test options
-    console.print("[bold]Available Custom Tests:[/bold]")
-    console.print("1. Phishing Simulation")
-    console.print("2. ClickFix Simulation")
-    console.print("3. Escalation Flow Simulation")
-    console.print("4. Back to Run Test Menu")
-    
-    choice = IntPrompt.ask("Enter your choice", default=1)
-    
-    if choice == 1:
-        # Run phishing simulation
-        phishing_simulation_menu()
-    elif choice == 2:
-        # Run ClickFix simulation
-        clickfix_simulation_menu()
-    elif choice == 3:
-        # Run Escalation Flow simulation
-        run_escalation_flow()
-    elif choice == 4:
-        # Go back
-        return
-    else:
-        console.print("[bold red]Invalid choice.[/bold red]")
-        pause()
-        custom_test_menu()  # Show the menu again
+    # Loop rather than recurse to show the menu again; the simulation
+    # submenus return here when the user goes back
+    while True:
+        print_header("Custom Tests")
+
+        # Show available custom test options
+        console.print("[bold]Available Custom Tests:[/bold]")
+        console.print("1. Phishing Simulation")
+        console.print("2. ClickFix Simulation")
+        console.print("3. Escalation Flow Simulation")
+        console.print("4. Back to Run Test Menu")
+
+        choice = IntPrompt.ask("Enter your choice", default=1)
+
+        if choice == 1:
+            # Run phishing simulation
+            phishing_simulation_menu()
+        elif choice == 2:
+            # Run ClickFix simulation
+            clickfix_simulation_menu()
+        elif choice == 3:
+            # Run Escalation Flow simulation
+            run_escalation_flow()
+            return
+        elif choice == 4:
+            # Go back
+            return
+        else:
+            console.print("[bold red]Invalid choice.[/bold red]")
+            pause()
+
+def _run_prereq_check(command: List[str], timeout: int) -> "subprocess.CompletedProcess[str]":
+    """Runs a prerequisite check command, raising if it fails or can't be started."""
+    return subprocess.run(command, capture_output=True, text=True, check=True, shell=False, timeout=timeout)
+
 
 def check_phishing_prerequisites(verbose: bool = True) -> bool:
     """Checks if all prerequisites for the phishing simulation are present."""
@@ -2097,9 +3016,15 @@ def check_phishing_prerequisites(verbose: bool = True) -> bool:
     if verbose:
         console.print("\n[bold]Checking Phishing Simulation Prerequisites:[/bold]")
 
+    # The Node.js and pip checks are independent subprocesses, so start both at once;
+    # their results are reported in order once both have finished
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        node_check = pool.submit(_run_prereq_check, ["node", "--version"], 10)
+        pip_check = pool.submit(_run_prereq_check, [sys.executable, "-m", "pip", "list", "--format=json"], 30)
+
     # 1. Check for Node.js
     try:
-        result = subprocess.run(["node", "--version"], capture_output=True, text=True, check=True, shell=False, timeout=10)
+        result = node_check.result()
         if verbose:
             console.print(f"[green]✓ Node.js found:[/green] {result.stdout.strip()}")
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
@@ -2114,10 +3039,7 @@ def check_phishing_prerequisites(verbose: bool = True) -> bool:
     
     try:
         # Get the list of installed packages using pip
-        pip_result = subprocess.run(
-            [sys.executable, "-m", "pip", "list", "--format=json"],
-            capture_output=True, text=True, check=True, shell=False, timeout=30
-        )
+        pip_result = pip_check.result()
         
         # Parse the JSON output
         installed_packages = {}
@@ -2242,48 +3164,34 @@ def install_phishing_prerequisites() -> None:
 
 def phishing_simulation_menu() -> None:
     """Display the phishing simulation menu and execute the selected operation."""
-    print_header("Phishing Simulation")
-    
-    # Options for phishing simulation
-    options = [
-        "Execute Phishing Simulation",
-        "Check Prerequisites Only",
-        "Install Prerequisites",
-        "Cleanup After Simulation",
-        "Back to Custom Tests Menu"
-    ]
-    
-    for i, option in enumerate(options, 1):
-        console.print(f"[bold cyan]{i}.[/bold cyan] {option}")
-    
-    choice = IntPrompt.ask("\nEnter your choice", default=1)
-    
-    if choice == 1:
-        # Execute the simulation
-        run_phishing_simulation() # Actually run it
-        phishing_simulation_menu() # Then return to menu
-    elif choice == 2:
-        # Check prerequisites
-        check_phishing_prerequisites(verbose=True)
-        pause()
-        phishing_simulation_menu()
-    elif choice == 3:
-        # Install prerequisites
-        install_phishing_prerequisites()
-        # install_phishing_prerequisites already has a pause
-        phishing_simulation_menu()
-    elif choice == 4:
-        # Cleanup
-        cleanup_phishing_simulation()
-        phishing_simulation_menu()
-    elif choice == 5:
-        # Go back
-        custom_test_menu()
-        return
-    else:
-        console.print("[bold red]Invalid choice.[/bold red]")
-        pause()
-        phishing_simulation_menu()  # Show the menu again
+    # Loop rather than recurse; going back returns to custom_test_menu's loop
+    while True:
+        print_header("Phishing Simulation")
+
+        console.print(_PHISHING_MENU_TEXT)
+
+        choice = IntPrompt.ask("\nEnter your choice", default=1)
+
+        if choice == 1:
+            # Execute the simulation
+            run_phishing_simulation() # Actually run it
+        elif choice == 2:
+            # Check prerequisites
+            check_phishing_prerequisites(verbose=True)
+            pause()
+        elif choice == 3:
+            # Install prerequisites
+            install_phishing_prerequisites()
+            # install_phishing_prerequisites already has a pause
+        elif choice == 4:
+            # Cleanup
+            cleanup_phishing_simulation()
+        elif choice == 5:
+            # Go back
+            return
+        else:
+            console.print("[bold red]Invalid choice.[/bold red]")
+            pause()
 
 
 def run_phishing_simulation() -> None:
@@ -2527,23 +3435,22 @@ def cleanup_phishing_simulation() -> None:
 
 def clickfix_simulation_menu() -> None:
     """Display the ClickFix simulation menu and execute the simulation."""
-    print_header("ClickFix Simulation")
-    
-    console.print("[bold]ClickFix Simulation Options:[/bold]")
-    console.print("1. Run ClickFix Simulation")
-    console.print("2. Back to Custom Tests Menu")
-    
-    choice = IntPrompt.ask("Enter your choice", default=1)
-    
-    if choice == 1:
-        run_clickfix_simulation()
-        clickfix_simulation_menu()
-    elif choice == 2:
-        return
-    else:
-        console.print("[bold red]Invalid choice.[/bold red]")
-        pause()
-        clickfix_simulation_menu()
+    while True:
+        print_header("ClickFix Simulation")
+
+        console.print("[bold]ClickFix Simulation Options:[/bold]")
+        console.print("1. Run ClickFix Simulation")
+        console.print("2. Back to Custom Tests Menu")
+
+        choice = IntPrompt.ask("Enter your choice", default=1)
+
+        if choice == 1:
+            run_clickfix_simulation()
+        elif choice == 2:
+            return
+        else:
+            console.print("[bold red]Invalid choice.[/bold red]")
+            pause()
 
 
 def run_clickfix_simulation() -> None:
@@ -2599,5 +3506,55 @@ def run_clickfix_simulation() -> None:
     pause()
 
 
+# List Tests menu handlers, keyed by choice; each returns the next screen
+_LIST_TESTS_DISPATCH: Final[Dict[int, Callable[[], MenuState]]] = {
+    1: _search_tests,
+    2: lambda: ("browse_by_tactic", {}),
+    3: lambda: ("browse_by_platform", {}),
+    4: _show_all_tests,
+    5: lambda: None, # Back to main menu
+}
+
+# Screens reachable from the List Tests menu, keyed by MenuState name
+_LIST_TESTS_SCREENS: Final[Dict[str, Callable[..., MenuState]]] = {
+    "list_tests": _list_tests_screen,
+    "browse_by_tactic": browse_by_tactic,
+    "browse_by_platform": browse_by_platform,
+    "tactics_for_platform": show_tactics_for_platform,
+    "techniques_for_platform_tactic": show_techniques_for_platform_tactic,
+    "techniques_for_tactic": show_techniques_for_tactic,
+}
+
+# Technique pickers for Run Test > Browse, keyed by choice
+_BROWSE_TECHNIQUES_DISPATCH: Final[Dict[int, Callable[[], Optional[str]]]] = {
+    1: _select_technique_by_tactic,
+    2: _select_technique_by_platform,
+}
+
+# Configuration setters, keyed by both the numbered config line and its "Set ..." option
+_CONFIG_SETTERS: Final = (
+    _set_atomics_path,
+    _set_powershell_path,
+    _set_timeout,
+    _set_phishing_site_path,
+    _set_phishing_module_path,
+)
+_CONFIG_DISPATCH: Final[Dict[int, Callable[[AppConfig], None]]] = {
+    **{i: setter for i, setter in enumerate(_CONFIG_SETTERS, 1)},
+    **{i: setter for i, setter in enumerate(_CONFIG_SETTERS, _CONFIG_OPTIONS_START)},
+}
+
+# Main menu handlers, indexed by choice - 1 (same order as _MAIN_MENU_OPTIONS)
+_DISPATCH: Final[Tuple[Callable[[], None], ...]] = (
+    list_tests_menu,
+    run_test_menu,
+    list_playbooks_menu,
+    run_playbook_menu,
+    show_help,
+    configuration_menu,
+    _exit,
+)
+
+
 if __name__ == "__main__":
     run_interactive_cli()
\ No newline at end of file